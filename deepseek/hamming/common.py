@@ -7,6 +7,10 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from GaluaField import GaluaField
 
+# Primitive polynomials come from src/galua
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+from galua.polynomials import primitive_polynomial
+
 
 def build_parity_check_matrix(
     code_length: int,
@@ -172,31 +176,7 @@ def validate_array_radix(array: np.ndarray, radix: int):
 
 def get_primitive_polynomial(radix: int, order: int) -> np.ndarray:
     """
-    Get primitive polynomial for given radix and order.
-    For demonstration purposes, we use some common primitive polynomials.
+    Get primitive polynomial for given radix and order (lowest degree first).
+    Taken from galua.polynomials, raises ValueError for non-prime radix.
     """
-    if radix == 2:
-        if order == 1:
-            return np.array([1, 1], dtype=np.int32)  # x + 1
-        elif order == 2:
-            return np.array([1, 1, 1], dtype=np.int32)  # x^2 + x + 1
-        elif order == 3:
-            return np.array([1, 0, 1, 1], dtype=np.int32)  # x^3 + x + 1
-        elif order == 4:
-            return np.array([1, 0, 0, 1, 1], dtype=np.int32)  # x^4 + x + 1
-    elif radix == 3:
-        if order == 1:
-            return np.array([1, 1], dtype=np.int32)  # x + 1
-        elif order == 2:
-            return np.array([1, 0, 1], dtype=np.int32)  # x^2 + 1
-    elif radix == 5:
-        if order == 1:
-            return np.array([1, 1], dtype=np.int32)  # x + 1
-        elif order == 2:
-            return np.array([1, 0, 2], dtype=np.int32)  # x^2 + 2
-    
-    # Default: use a simple polynomial (may not be primitive for all cases)
-    poly = np.zeros(order + 1, dtype=np.int32)
-    poly[0] = 1
-    poly[-1] = 1
-    return poly
\ No newline at end of file
+    return np.array(primitive_polynomial(radix, order), dtype=np.int32)
\ No newline at end of file
@@ -20,9 +20,12 @@ class GF2m:
 
         # Примитивный многочлен
         if primitive_poly is None:
-            if m not in self.PRIMITIVE_POLYNOMIALS:
-                raise ValueError(f"Примитивный многочлен для GF(2^{m}) не определен")
-            self.primitive_poly = self.PRIMITIVE_POLYNOMIALS[m]
+            if m in self.PRIMITIVE_POLYNOMIALS:
+                self.primitive_poly = self.PRIMITIVE_POLYNOMIALS[m]
+            else:
+                # остальные берем из таблицы galua (там старший коэффициент последний)
+                from galua.polynomials import primitive_polynomial
+                self.primitive_poly = primitive_polynomial(2, m)[::-1]
         else:
             self.primitive_poly = primitive_poly
 
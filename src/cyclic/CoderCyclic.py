@@ -1,5 +1,7 @@
 import numpy as np
 
+from linalg.bit_packed import build_encoding_tables, binary_encode
+
 class Coder:
     def __init__(self, k, n, vect):
         self.k = k
@@ -10,6 +12,8 @@ class Coder:
         self.generator_matrix[0, :len(vect)] = vect
         for i in range(1, k):
             self.generator_matrix[i] = np.roll(self.generator_matrix[i - 1], 1)
+
+        self.encoding_tables = build_encoding_tables(self.generator_matrix)
     
     def coding(self, words):
-        return words @ self.generator_matrix % 2
+        return binary_encode(words, self.encoding_tables, self.n).astype(int)
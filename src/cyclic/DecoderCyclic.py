@@ -1,5 +1,5 @@
 import numpy as np
-from linalg.code_matrix import find_error_with_scalar, solve_linear_mod
+from linalg.code_matrix import find_error_with_scalar, solve_linear_mod, split_erasures
 
 class Decoder:
     def __init__(self, k, n, vect):
@@ -17,52 +17,28 @@ class Decoder:
         if words.size == 0:
             return words
 
-        if words.dtype.type is np.str_ or words.dtype.kind in ('U', 'S'):
-            sym = words
-            corrected = np.zeros(sym.shape, dtype=int)
-            H = self.check_matrix
-            q = 2
-            for i in range(sym.shape[0]):
-                row = sym[i]
-                er_mask = (row == 'z')
-
-                known_int = np.zeros(row.shape, dtype=int)
-                known_int[~er_mask] = np.array([int(c) for c in row[~er_mask]], dtype=int)
-                s = (H @ known_int) % q
-                if np.any(er_mask):
-                    A = H[:, er_mask]
-                    b = (-s) % q
-                    x, ok = solve_linear_mod(A, b, q)
-                    if ok:
-                        fill = known_int.copy()
-                        fill[er_mask] = x
-                        corrected[i] = fill % q
-                        continue
-
-                y = known_int.copy()
-                s = (H @ y) % q
-                if np.all(s == 0):
-                    corrected[i] = y
-                    continue
-                j, a = find_error_with_scalar(s, H, q)
-                if j is not None and a is not None:
-                    y[j] = (y[j] - a) % q
-                corrected[i] = y
-            return corrected
-
-        corrected = words.copy()
         H = self.check_matrix
         q = 2
 
+        # numeric words with erasure_symbol or symbol arrays with 'z'
+        corrected, erased = split_erasures(words, q)
+
         for i in range(corrected.shape[0]):
             y = corrected[i]
             s = (H @ y) % q
 
+            er_mask = erased[i]
+            if np.any(er_mask):
+                x, ok = solve_linear_mod(H[:, er_mask], (-s) % q, q)
+                if ok:
+                    y[er_mask] = x % q
+                    continue
+
             if np.all(s == 0):
                 continue
 
             j, a = find_error_with_scalar(s, H, q)
             if j is not None and a is not None:
-                corrected[i, j] = (corrected[i, j] - a) % q
+                y[j] = (y[j] - a) % q
 
-        return corrected
\ No newline at end of file
+        return corrected
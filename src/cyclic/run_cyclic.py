@@ -21,19 +21,18 @@ def run_cyclic():
 
     coded = coder.coding(words)
     noisy = gen.generate_data_thread(
-        coded.astype(str),
+        coded,
         [0.0, 0.0],         
         one_error_per_word=True, 
         fixed_erasures_per_word=0 
     )
 
     received = noisy
-    received_int = received.astype(int)
     decoder = Decoder(k, n, poly)
     print(f"\n\n---- Check matrix {r} x {n} ----")
     print(decoder.check_matrix)
     print()
-    decoded = decoder.detect_and_correct(received_int)
+    decoded = decoder.detect_and_correct(received)
     print("   info  |       coded       |      decoded ")
     for i in range(words.shape[0]): 
         s_info = ''.join(map(str, words[i].tolist()))
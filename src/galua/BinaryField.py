@@ -0,0 +1,224 @@
+import numpy as np
+
+
+# _SPREAD[b] has bits of byte b moved to even positions, square of b over GF(2)
+_SPREAD = np.zeros(256, dtype=np.uint64)
+for _bit in range(8):
+    _SPREAD[(np.arange(256) >> _bit) & 1 == 1] |= np.uint64(1 << (2 * _bit))
+
+
+class BinaryField:
+    '''
+    Table-free GF(2^orp) for orp up to 64. Elements are packed into uint64
+    (bit i is coefficient of v^i), operations are vectorized over arrays:
+    carry-less shift-and-xor multiply, reduction by folding the high part
+    through the sparse pol - x^orp, inversion by exponentiation.
+    Memory does not depend on orp.
+    '''
+
+    max_orp = 64
+
+    # elements multiplied at once, bounds memory of 4 bit window tables
+    chunk_size = 1 << 12
+
+    def __init__(self, orp: int, pol: list[int] = None):
+
+        if not isinstance(orp, int):
+            raise ValueError("Incorrect datatype")
+
+        if 0 < orp <= self.max_orp:
+            self.__orp = orp
+        else:
+            raise ValueError("Incorrect orp")
+
+        if pol is None:
+            from galua.polynomials import primitive_polynomial
+            pol = primitive_polynomial(2, orp)
+
+        if all([i in (0, 1) for i in pol]) and (len(pol) == orp + 1) and pol[-1] == 1:
+            self.__pol = np.array(pol)
+        else:
+            raise ValueError("Incorrect pol")
+
+        self.__pow = 1 << orp
+        self.__mask = np.uint64(self.__pow - 1)
+
+        # exponents of nonzero terms of pol - x^orp, fold of high part
+        self.__terms = [np.uint64(i) for i in range(orp) if pol[i]]
+
+    @property
+    def chr(self):
+        return 2
+
+    @property
+    def orp(self):
+        return self.__orp
+
+    @property
+    def pol(self):
+        return self.__pol
+
+    @property
+    def pow(self):
+        return self.__pow
+
+    @property
+    def order(self):
+        '''
+        Size of multiplicative group, pow - 1
+        '''
+        return self.__pow - 1
+
+    def __eq__(self, other):
+        if not isinstance(other, BinaryField):
+            return False
+        return self.orp == other.orp and np.array_equal(self.pol, other.pol)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.orp, tuple(int(i) for i in self.pol)))
+
+    def __str__(self):
+        return f"GF(2^{self.orp})"
+
+    def elements(self, values) -> np.ndarray:
+        '''
+        Packed uint64 array of field elements, range checked
+        '''
+        values = np.asarray(values)
+        if values.dtype.kind not in 'ui':
+            raise ValueError("Incorrect datatype")
+        if values.dtype.kind == 'i' and np.any(values < 0):
+            raise ValueError("Incorrect value")
+
+        values = values.astype(np.uint64)
+        if np.any(values & ~self.__mask):
+            raise ValueError("Incorrect value")
+        return values
+
+    def add(self, a, b) -> np.ndarray:
+        return np.bitwise_xor(self.elements(a), self.elements(b))
+
+    sub = add
+
+    def mul(self, a, b) -> np.ndarray:
+        a, b = np.broadcast_arrays(self.elements(a), self.elements(b))
+        return self.__reduce(*self.__clmul(a, b))
+
+    def square(self, a) -> np.ndarray:
+        return self.__reduce(*self.__spread(self.elements(a)))
+
+    def power(self, a, exponent: int) -> np.ndarray:
+        a = self.elements(a)
+
+        if exponent < 0:
+            return self.power(self.inv(a), -exponent)
+
+        result = np.ones(a.shape, dtype=np.uint64)
+        base = a
+        while exponent:
+            if exponent & 1:
+                result = self.__reduce(*self.__clmul(result, base))
+            exponent >>= 1
+            if exponent:
+                base = self.__reduce(*self.__spread(base))
+        return result
+
+    def inv(self, a) -> np.ndarray:
+        '''
+        a^(pow - 2) = a^2 * a^4 * ... * a^(2^(orp - 1))
+        '''
+        a = self.elements(a)
+        if np.any(a == 0):
+            raise ZeroDivisionError("Zero has no inverse element")
+
+        result = np.ones(a.shape, dtype=np.uint64)
+        square = a
+        for _ in range(1, self.orp):
+            square = self.__reduce(*self.__spread(square))
+            result = self.__reduce(*self.__clmul(result, square))
+        return result
+
+    def div(self, a, b) -> np.ndarray:
+        return self.mul(a, self.inv(b))
+
+    def sum(self, a, axis: int = None) -> np.ndarray:
+        return np.bitwise_xor.reduce(self.elements(a), axis=axis)
+
+    def __clmul(self, a, b):
+        # 128 bit carry-less product as (high, low) words
+        shape = a.shape
+        a, b = a.ravel(), b.ravel()
+
+        high = np.zeros(a.size, dtype=np.uint64)
+        low = np.zeros(a.size, dtype=np.uint64)
+
+        for start in range(0, a.size, self.chunk_size):
+            part = slice(start, start + self.chunk_size)
+            high[part], low[part] = self.__clmul_window(a[part], b[part])
+
+        return high.reshape(shape), low.reshape(shape)
+
+    def __clmul_window(self, a, b):
+        # products of a by all 4 bit polynomials, one gather per nibble of b
+        table_high = np.zeros((16,) + a.shape, dtype=np.uint64)
+        table_low = np.zeros((16,) + a.shape, dtype=np.uint64)
+
+        for k in range(1, 16):
+            i = k.bit_length() - 1
+            rest = k ^ (1 << i)
+            table_low[k] = table_low[rest] ^ (a << np.uint64(i))
+            if i > 0:
+                table_high[k] = table_high[rest] ^ (a >> np.uint64(64 - i))
+
+        columns = np.arange(a.size)
+        high = np.zeros(a.shape, dtype=np.uint64)
+        low = np.zeros(a.shape, dtype=np.uint64)
+
+        for j in range(0, self.orp, 4):
+            shift = np.uint64(j)
+            nibble = ((b >> shift) & np.uint64(15)).astype(np.intp)
+            part_high = table_high[nibble, columns]
+            part_low = table_low[nibble, columns]
+
+            low ^= part_low << shift
+            high ^= part_high << shift
+            if j > 0:
+                high ^= part_low >> np.uint64(64 - j)
+
+        return high, low
+
+    def __spread(self, a):
+        # square is linear over GF(2): bit i of a goes to bit 2i
+        high = np.zeros(a.shape, dtype=np.uint64)
+        low = np.zeros(a.shape, dtype=np.uint64)
+
+        for byte in range(8):
+            spread = _SPREAD[((a >> np.uint64(8 * byte)) & np.uint64(0xFF)).astype(np.intp)]
+            if byte < 4:
+                low |= spread << np.uint64(16 * byte)
+            else:
+                high |= spread << np.uint64(16 * (byte - 4))
+
+        return high, low
+
+    def __reduce(self, high, low):
+        # x^orp = pol - x^orp, fold bits above orp until none are left
+        orp = self.orp
+        while True:
+            if orp == 64:
+                top = high
+            else:
+                top = (low >> np.uint64(orp)) | (high << np.uint64(64 - orp))
+                low = low & self.__mask
+
+            if not np.any(top):
+                return low
+
+            high = np.zeros(low.shape, dtype=np.uint64)
+            for term in self.__terms:
+                low = low ^ (top << term)
+                if term > 0:
+                    high ^= top >> (np.uint64(64) - term)
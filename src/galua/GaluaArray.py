@@ -0,0 +1,278 @@
+import numpy as np
+
+from galua.GaluaField import GaluaField
+from galua.GaluaElement import GaluaElement
+
+
+class GaluaArray:
+    '''
+    Array of GF(chr^orp) elements stored in packed form (sum(c_i * chr^i)).
+    Arithmetic is elementwise with numpy broadcasting, matmul is over the field.
+    '''
+
+    def __init__(self, gf: GaluaField, values):
+
+        self.__gf = gf
+
+        packed = np.asarray(values, dtype=np.int64)
+
+        if np.all(packed >= 0) and np.all(packed < gf.pow):
+            self.__packed = packed
+        else:
+            raise ValueError("Incorrect value")
+
+    @classmethod
+    def from_vectors(cls, gf: GaluaField, vectors):
+        '''
+        Create array from coefficients vectors, last axis has orp length
+        '''
+        vectors = np.asarray(vectors, dtype=np.int64)
+
+        if vectors.shape[-1:] != (gf.orp,):
+            raise ValueError("Incorrect value")
+
+        return cls(gf, vectors @ np.power(gf.chr, np.arange(gf.orp, dtype=np.int64)))
+
+    @classmethod
+    def _wrap(cls, gf: GaluaField, packed: np.ndarray):
+        # trusted constructor for results of field operations
+        array = cls.__new__(cls)
+        array.__gf = gf
+        array.__packed = packed
+        return array
+
+    @property
+    def gf(self):
+        return self.__gf
+
+    @property
+    def packed(self):
+        return self.__packed
+
+    @property
+    def shape(self):
+        return self.__packed.shape
+
+    @property
+    def ndim(self):
+        return self.__packed.ndim
+
+    @property
+    def size(self):
+        return self.__packed.size
+
+    @property
+    def T(self):
+        return GaluaArray._wrap(self.gf, self.__packed.T)
+
+    def reshape(self, *shape):
+        return GaluaArray._wrap(self.gf, self.__packed.reshape(*shape))
+
+    def to_vectors(self) -> np.ndarray:
+        '''
+        Coefficients vectors of elements, shape is self.shape + (orp,)
+        '''
+        weights = np.power(self.gf.chr, np.arange(self.gf.orp, dtype=np.int64))
+        return ((self.__packed[..., np.newaxis] // weights) % self.gf.chr).astype(self.gf.local_dtype)
+
+    def __len__(self):
+        return len(self.__packed)
+
+    def __getitem__(self, key):
+        return GaluaArray._wrap(self.gf, self.__packed[key])
+
+    def __setitem__(self, key, value):
+        self.__packed[key] = self.__coerce(value)
+
+    def __eq__(self, other):
+        return self.__packed == self.__coerce(other)
+
+    def __ne__(self, other):
+        return self.__packed != self.__coerce(other)
+
+    def __str__(self):
+        return f"GF({self.gf.pow} = {self.gf.chr}^{self.gf.orp}) " + str(self.__packed)
+
+    __repr__ = __str__
+
+    # ---------------- elementwise arithmetic ----------------
+
+    def __add__(self, other):
+        return GaluaArray._wrap(self.gf, _add(self.gf, self.__packed, self.__coerce(other)))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return GaluaArray._wrap(self.gf, _add(self.gf, self.__packed, _neg(self.gf, self.__coerce(other))))
+
+    def __rsub__(self, other):
+        return GaluaArray._wrap(self.gf, _add(self.gf, self.__coerce(other), _neg(self.gf, self.__packed)))
+
+    def __neg__(self):
+        return GaluaArray._wrap(self.gf, _neg(self.gf, self.__packed))
+
+    def __mul__(self, other):
+        return GaluaArray._wrap(self.gf, _mul(self.gf, self.__packed, self.__coerce(other)))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        return GaluaArray._wrap(self.gf, _mul(self.gf, self.__packed, _inv(self.gf, self.__coerce(other))))
+
+    def __rtruediv__(self, other):
+        return GaluaArray._wrap(self.gf, _mul(self.gf, self.__coerce(other), _inv(self.gf, self.__packed)))
+
+    __floordiv__ = __truediv__
+
+    __rfloordiv__ = __rtruediv__
+
+    def __pow__(self, exponent: int):
+        return GaluaArray._wrap(self.gf, _power(self.gf, self.__packed, int(exponent)))
+
+    def inverse(self):
+        return GaluaArray._wrap(self.gf, _inv(self.gf, self.__packed))
+
+    # ---------------- reductions and products ----------------
+
+    def sum(self, axis=None):
+        packed = self.__packed.ravel() if axis is None else self.__packed
+        return GaluaArray._wrap(self.gf, _sum(self.gf, packed, 0 if axis is None else axis))
+
+    def dot(self, other):
+        return self @ other
+
+    def __matmul__(self, other):
+        other = self.__coerce(other)
+        return GaluaArray._wrap(self.gf, _matmul(self.gf, self.__packed, other))
+
+    def __rmatmul__(self, other):
+        other = self.__coerce(other)
+        return GaluaArray._wrap(self.gf, _matmul(self.gf, other, self.__packed))
+
+    def __coerce(self, other) -> np.ndarray:
+        if isinstance(other, GaluaArray):
+            if other.gf != self.gf:
+                raise ValueError("Elements of different fields")
+            return other.packed
+        if isinstance(other, GaluaElement):
+            if other.gf != self.gf:
+                raise ValueError("Elements of different fields")
+            return np.int64(other.packed)
+        return GaluaArray(self.gf, other).packed
+
+
+def _digits(gf: GaluaField, packed: np.ndarray):
+    weight = 1
+    for _ in range(gf.orp):
+        yield weight, (packed // weight) % gf.chr
+        weight *= gf.chr
+
+
+def _add(gf: GaluaField, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    if gf.chr == 2:
+        return np.bitwise_xor(a, b)
+
+    if gf.has_tables:
+        return gf.table_add(a, b).astype(np.int64)
+
+    a, b = np.broadcast_arrays(a, b)
+    result = np.zeros(a.shape, dtype=np.int64)
+    weight = 1
+    for _ in range(gf.orp):
+        result += ((a // weight + b // weight) % gf.chr) * weight
+        weight *= gf.chr
+    return result
+
+
+def _neg(gf: GaluaField, a: np.ndarray) -> np.ndarray:
+    if gf.chr == 2:
+        return a
+
+    result = np.zeros(np.shape(a), dtype=np.int64)
+    for weight, digit in _digits(gf, a):
+        result += ((gf.chr - digit) % gf.chr) * weight
+    return result
+
+
+def _logarithm(gf: GaluaField, a: np.ndarray) -> np.ndarray:
+    if gf.order != gf.pow - 1:
+        raise ValueError("Multiplication needs primitive polynomial of field")
+    # log is stored in compact dtype, widen it before adding or scaling
+    return gf.log[a].astype(np.int64)
+
+
+def _exp(gf: GaluaField, i: np.ndarray) -> np.ndarray:
+    return gf.exp[i].astype(np.int64)
+
+
+def _mul(gf: GaluaField, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    if gf.has_tables and gf.order == gf.pow - 1:
+        return gf.table_mul(a, b).astype(np.int64)
+
+    result = _exp(gf, (_logarithm(gf, a) + _logarithm(gf, b)) % gf.order)
+    return np.where((a == 0) | (b == 0), 0, result)
+
+
+def _inv(gf: GaluaField, a: np.ndarray) -> np.ndarray:
+    if np.any(a == 0):
+        raise ZeroDivisionError("Zero has no inverse element")
+    return _exp(gf, (-_logarithm(gf, a)) % gf.order)
+
+
+def _power(gf: GaluaField, a: np.ndarray, exponent: int) -> np.ndarray:
+    if exponent < 0:
+        return _power(gf, _inv(gf, a), -exponent)
+
+    # reduced first, log * exponent must fit int64
+    result = _exp(gf, (_logarithm(gf, a) * (exponent % gf.order)) % gf.order)
+    return np.where(a == 0, 0 if exponent > 0 else 1, result)
+
+
+def _sum(gf: GaluaField, a: np.ndarray, axis: int) -> np.ndarray:
+    if gf.chr == 2:
+        return np.bitwise_xor.reduce(a, axis=axis)
+
+    result = 0
+    for weight, digit in _digits(gf, a):
+        result = result + (digit.sum(axis=axis) % gf.chr) * weight
+    return np.asarray(result, dtype=np.int64)
+
+
+def _matmul(gf: GaluaField, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    a_vector, b_vector = a.ndim == 1, b.ndim == 1
+    a = a[np.newaxis, :] if a_vector else a
+    b = b[:, np.newaxis] if b_vector else b
+
+    if a.shape[1] != b.shape[0]:
+        raise ValueError("Incorrect shapes for matmul")
+
+    if gf.chr == 2:
+        result = np.zeros((a.shape[0], b.shape[1]), dtype=np.int64)
+        for j in range(a.shape[1]):
+            result ^= _mul(gf, a[:, j, np.newaxis], b[np.newaxis, j, :])
+    elif gf.has_tables:
+        # uint8 table elements, packed arrays are int64 as on other paths
+        result = np.zeros((a.shape[0], b.shape[1]), dtype=np.uint8)
+        for j in range(a.shape[1]):
+            result = gf.table_add(result, gf.table_mul(a[:, j, np.newaxis], b[np.newaxis, j, :]))
+        result = result.astype(np.int64)
+    else:
+        result = _matmul_digits(gf, a, b)
+
+    if a_vector:
+        result = result[0]
+    if b_vector:
+        result = result[..., 0]
+    return result
+
+
+def _matmul_digits(gf: GaluaField, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    # accumulate products of a[:, j] and b[j, :] digit by digit, reduce once
+    accumulator = np.zeros((gf.orp, a.shape[0], b.shape[1]), dtype=np.int64)
+    for j in range(a.shape[1]):
+        product = _mul(gf, a[:, j, np.newaxis], b[np.newaxis, j, :])
+        for d, (_, digit) in enumerate(_digits(gf, product)):
+            accumulator[d] += digit
+
+    weights = np.power(gf.chr, np.arange(gf.orp, dtype=np.int64))
+    return np.tensordot(weights, accumulator % gf.chr, axes=1)
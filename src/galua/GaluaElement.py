@@ -8,8 +8,21 @@ class GaluaElement:
 
         if np.all(value >= 0) and np.all(value < gf.chr) and (value.size == gf.orp):
             self.__value = value
+            self.__packed = gf.to_int(value)
         else:
             raise ValueError("Incorrect value")
+
+    @classmethod
+    def from_int(cls, gf: GaluaField, packed: int):
+        '''
+        Create element from packed form without range checks
+        '''
+        element = cls.__new__(cls)
+        element.__gf = gf
+        element.__packed = packed
+        element.__value = None
+        return element
+
 # np.array(list(a)).astype(int)
     @property
     def gf(self):
@@ -17,7 +30,13 @@ class GaluaElement:
     
     @property
     def value(self):
+        if self.__value is None:
+            self.__value = self.gf.to_vector(self.__packed)
         return self.__value
+
+    @property
+    def packed(self):
+        return self.__packed
     
     def __add__(self, other):
         if self.gf == other.gf:
@@ -32,42 +51,29 @@ class GaluaElement:
             raise ValueError
     
     def __mul__(self, other):
-        i = self.find_index()
-        j = other.find_index()
-
-        z = 1 if i + j > self.gf.pow else 0
-
-        value = self.gf.values[(i + j - 1) % self.gf.pow + z]
-
-        if i == 0 or j == 0:
-            value = self.gf.values[0]
-
-        return GaluaElement(self.gf, value.reshape(self.gf.orp))
+        return GaluaElement.from_int(self.gf, self.gf.mul(self.packed, other.packed))
     
     def __floordiv__(self, other):
-        i = self.find_index()
-        j = other.find_index()
-        
-        if j == 0:
-            raise ZeroDivisionError("Field does not has zero divisors")
-        elif j == 1:
-            return self * GaluaElement(self.gf, self.gf.values[1].reshape(self.gf.orp))
-        else:
-            return self * GaluaElement(self.gf, self.gf.values[1 + self.gf.pow - j].reshape(self.gf.orp))
+        return GaluaElement.from_int(self.gf, self.gf.div(self.packed, other.packed))
+
+    def __pow__(self, exponent: int):
+        return GaluaElement.from_int(self.gf, self.gf.power(self.packed, exponent))
+
+    def inverse(self):
+        return GaluaElement.from_int(self.gf, self.gf.inv(self.packed))
     
     def __eq__(self, other):
 
-        return (self.gf == other.gf) and (np.all(self.value == other.value))
+        return (self.gf == other.gf) and (self.packed == other.packed)
 
     def __str__(self):
         i = self.find_index()[0]
         return f"{'v^'+str(i-1) if i>1 else i} : " + str(self.value)
 
     def find_index(self):
-        return np.where(np.all(self.gf.values == self.value, axis=1))[0]
+        return np.array([self.gf.index(self.packed)])
 
     # def __mul_shft(self, a, b):
     #     i = np.where(self.gf.values == self.value)[0]
     #     j = np.where(self.gf.values == self.value)[0]
     #     return GaluaElement(self.gf, self.gf.values[(a + b) % self.gf.pow])
-
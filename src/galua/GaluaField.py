@@ -1,8 +1,84 @@
 import numpy as np
 
+from collections import OrderedDict
+
+from galua import store
+
+
+def binary_powers(pol, orp: int, count: int | None = None) -> np.ndarray:
+    '''
+    Packed powers v^0, ..., v^(count - 1) modulo binary pol (lower orp
+    coefficients are used, count defaults to 2^orp - 1), bit i is
+    coefficient of v^i. Multiplication by v is shift and xor, block
+    v^[k, 2k) is block v^[0, k) times v^k through byte tables
+    '''
+    if count is None:
+        count = (1 << orp) - 1
+
+    reduction = sum(1 << i for i in range(orp) if int(pol[i]) % 2)
+    top = 1 << orp
+
+    def shift(value):
+        value <<= 1
+        return (value ^ top ^ reduction) if value & top else value
+
+    dtype = next(t for t in (np.uint8, np.uint16, np.uint32, np.uint64) if orp <= np.iinfo(t).bits)
+
+    powers = np.zeros(count, dtype=dtype)
+    powers[0] = 1
+
+    byte = np.arange(256, dtype=np.int64)
+
+    done = 1
+    while done < count:
+        # basis[j] is v^(done + j)
+        basis = []
+        current = shift(int(powers[done - 1]))
+        for _ in range(orp):
+            basis.append(current)
+            current = shift(current)
+
+        size = min(done, count - done)
+        block = powers[:size]
+        result = np.zeros(size, dtype=dtype)
+
+        for low in range(0, orp, 8):
+            table = np.zeros(256, dtype=dtype)
+            for bit in range(min(8, orp - low)):
+                table[(byte >> bit) & 1 == 1] ^= dtype(basis[low + bit])
+            result ^= table[(block >> dtype(low)) & dtype(0xFF)]
+
+        powers[done:done + size] = result
+        done += size
+
+    return powers
+
+
 class GaluaField:
+
+    # fields up to this size can hold dense uint8 add/mul tables
+    small_pow = 256
+
+    # fields are interned by (chr, orp, pol), least recently used are evicted
+    cache_size = 32
+    __instances = OrderedDict()
+
+    def __new__(cls, chr: int, orp: int, pol: list[int]):
+
+        key = cls.__make_key(chr, orp, pol)
+        field = cls.__instances.get(key) if key is not None else None
+
+        if field is not None:
+            cls.__instances.move_to_end(key)
+            return field
+
+        return super().__new__(cls)
     
     def __init__(self, chr: int, orp: int, pol: list[int]):
+
+        # interned instance returned by __new__ is already built
+        if getattr(self, '_GaluaField__key', None) is not None:
+            return
         
         if (not isinstance(chr, int)) or (not isinstance(orp, int)):
             raise ValueError("Incorrect datatype")
@@ -25,11 +101,40 @@ class GaluaField:
             self.__local_dtype = self.pol.dtype
         else:
             raise ValueError("Incorrect pol")
+
+        # checked once per interned key, v must generate all nonzero elements
+        from galua.polynomials import is_primitive
+        if not is_primitive(chr, pol):
+            raise ValueError("pol is not primitive")
         
         self.__pow = int(np.power(self.__chr, self.__orp))
-        self.__values = np.zeros((self.__pow, self.__orp), dtype=self.local_dtype)
+        self.__packed_dtype = self.__min_dtype(self.__pow - 1, np.uint8, np.uint16, np.uint32, np.uint64)
+
+        # coefficients table is built from packed powers on first access
+        self.__values = None
 
-        self.__calculate_values()
+        # weights of coefficients in packed (base chr) form of element
+        self.__weights = np.power(self.__chr, np.arange(self.__orp, dtype=np.int64))
+
+        # power tables of large fields may come from on-disk store
+        if not self.__load_tables(chr, orp, pol):
+            self.__calculate_powers()
+            self.__calculate_tables()
+            self.__save_tables(chr, orp, pol)
+
+        self.__add_table = None
+        self.__mul_table = None
+        self.__neg_table = None
+        self.__inv_table = None
+
+        self.__cosets = None
+        self.__minimal_polynomials = None
+
+        for table in (self.__pol, self.__weights, self.__powers, self.__log):
+            table.flags.writeable = False
+
+        self.__key = self.__make_key(chr, orp, pol)
+        self.__intern()
         
     @property
     def local_dtype(self):
@@ -51,12 +156,53 @@ class GaluaField:
     def pow(self):
         return self.__pow
     
+    @property
+    def packed_dtype(self):
+        '''
+        Smallest unsigned dtype holding packed elements of field
+        '''
+        return self.__packed_dtype
+
     @property
     def values(self):
+        '''
+        values[0] is zero, values[i] is coefficients vector of v^(i-1),
+        built from packed powers on first access
+        '''
+        if self.__values is None:
+            self.__values = self.__build_values()
         return self.__values
+
+    @property
+    def exp(self):
+        '''
+        exp[i] is packed form of v^i, i in [0, order)
+        '''
+        return self.__exp
+
+    @property
+    def log(self):
+        '''
+        log[a] is i such that v^i == a, -1 for zero (and for elements
+        which are not powers of v when pol is not primitive)
+        '''
+        return self.__log
+
+    @property
+    def order(self):
+        '''
+        Multiplicative order of v (equals pow - 1 for primitive pol)
+        '''
+        return self.__order
     
         
+    def __hash__(self):
+        return hash(self.__key)
+
     def __eq__(self, other):
+        if self is other:
+            return True
+
         result = True
 
         result = result and (self.orp == other.orp)
@@ -67,6 +213,9 @@ class GaluaField:
     
     
     def __ne__(self, other):
+        if self is other:
+            return False
+
         result = False
 
         result = result or (self.orp != other.orp)
@@ -76,6 +225,295 @@ class GaluaField:
         return result
 
 
+    @classmethod
+    def primitive(cls, chr: int, orp: int):
+        '''
+        Field GF(chr^orp) built on lowest weight primitive polynomial
+        '''
+        from galua.polynomials import primitive_polynomial
+        return cls(chr, orp, primitive_polynomial(chr, orp))
+
+    @property
+    def is_primitive(self):
+        return self.order == self.pow - 1
+
+    @classmethod
+    def cache_clear(cls):
+        cls.__instances.clear()
+
+    @staticmethod
+    def __make_key(chr, orp, pol):
+        # bad arguments get no key, __init__ reports them
+        if (not isinstance(chr, int)) or (not isinstance(orp, int)):
+            return None
+        try:
+            return (chr, orp, tuple(int(i) for i in pol))
+        except (TypeError, ValueError):
+            return None
+
+    def __intern(self):
+        instances = GaluaField.__instances
+
+        instances[self.__key] = self
+        instances.move_to_end(self.__key)
+
+        while len(instances) > self.cache_size:
+            instances.popitem(last=False)
+
+    def to_int(self, vector) -> int:
+        '''
+        Pack coefficients vector into integer: sum(c_i * chr^i)
+        '''
+        return int(np.dot(np.asarray(vector, dtype=np.int64), self.__weights))
+
+    def to_vector(self, value: int) -> np.ndarray:
+        '''
+        Unpack integer into coefficients vector of length orp
+        '''
+        return ((value // self.__weights) % self.chr).astype(self.local_dtype)
+
+    def index(self, value: int) -> int:
+        '''
+        Row of values table for packed element
+        '''
+        if value == 0:
+            return 0
+        return self.__logarithm(value) + 1
+
+    def mul(self, a: int, b: int) -> int:
+        if a == 0 or b == 0:
+            return 0
+        return int(self.__exp[(self.__logarithm(a) + self.__logarithm(b)) % self.__order])
+
+    def div(self, a: int, b: int) -> int:
+        if b == 0:
+            raise ZeroDivisionError("Field does not has zero divisors")
+        if a == 0:
+            return 0
+        return int(self.__exp[(self.__logarithm(a) - self.__logarithm(b)) % self.__order])
+
+    def inv(self, a: int) -> int:
+        if a == 0:
+            raise ZeroDivisionError("Zero has no inverse element")
+        return int(self.__exp[(-self.__logarithm(a)) % self.__order])
+
+    def power(self, a: int, exponent: int) -> int:
+        if a == 0:
+            if exponent < 0:
+                raise ZeroDivisionError("Zero has no inverse element")
+            return 0 if exponent > 0 else 1
+        return int(self.__exp[(self.__logarithm(a) * exponent) % self.__order])
+
+    @property
+    def has_tables(self):
+        return self.pow <= self.small_pow
+
+    @property
+    def add_table(self):
+        '''
+        add_table[a, b] is packed a + b, built on first access
+        '''
+        if self.__add_table is None:
+            self.__add_table = self.__build_add_table()
+            self.__neg_table = self.__solve_table(self.__add_table, 0)
+        return self.__add_table
+
+    @property
+    def mul_table(self):
+        '''
+        mul_table[a, b] is packed a * b, built on first access
+        '''
+        if self.__mul_table is None:
+            self.__mul_table = self.__build_mul_table()
+            # zero has no inverse, it maps to zero
+            self.__inv_table = self.__solve_table(self.__mul_table, 1)
+        return self.__mul_table
+
+    @property
+    def neg_table(self):
+        '''
+        neg_table[a] is packed -a, built with add_table
+        '''
+        if self.__neg_table is None:
+            self.add_table
+        return self.__neg_table
+
+    @property
+    def inv_table(self):
+        '''
+        inv_table[a] is packed 1 / a (0 for zero), built with mul_table
+        '''
+        if self.__inv_table is None:
+            self.mul_table
+        return self.__inv_table
+
+    def precompute_tables(self):
+        '''
+        Build add/mul tables with neg/inv tables now instead of on first access
+        '''
+        self.__add_table = self.add_table
+        self.__mul_table = self.mul_table
+        return self
+
+    def table_add(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        return self.add_table[a, b]
+
+    def table_mul(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        return self.mul_table[a, b]
+
+    def table_sum(self, a: np.ndarray, axis: int = -1) -> np.ndarray:
+        '''
+        Sum over axis by pairwise folding with add_table gathers
+        '''
+        a = np.moveaxis(np.asarray(a), axis, -1)
+        if a.shape[-1] == 0:
+            return np.zeros(a.shape[:-1], dtype=np.uint8)
+
+        while a.shape[-1] > 1:
+            half = a.shape[-1] // 2
+            folded = self.add_table[a[..., :half], a[..., half:2 * half]]
+            if a.shape[-1] % 2 == 1:
+                folded = np.concatenate([folded, a[..., -1:]], axis=-1)
+            a = folded
+
+        return a[..., 0]
+
+    def table_matvec(self, A: np.ndarray, x: np.ndarray) -> np.ndarray:
+        '''
+        A @ x over field, x is vector [m] or batch of vectors [b x m]
+        '''
+        A = np.asarray(A)
+        x = np.asarray(x)
+        return self.table_sum(self.mul_table[A, x[..., np.newaxis, :]], axis=-1)
+
+    @property
+    def coset_leaders(self):
+        '''
+        coset_leaders[i] is smallest exponent in cyclotomic coset of i
+        modulo pow - 1, built on first access
+        '''
+        return self.__build_cosets()[0]
+
+    @property
+    def cyclotomic_cosets(self):
+        '''
+        Cyclotomic cosets {i, i*chr, i*chr^2, ...} modulo pow - 1 ordered
+        by leader, each one starts from its leader
+        '''
+        return self.__build_cosets()[1]
+
+    @property
+    def minimal_polynomials(self):
+        '''
+        Dict leader -> minimal polynomial over GF(chr) of v^leader,
+        coefficients in pol order (lowest power first)
+        '''
+        if self.__minimal_polynomials is None:
+            self.__minimal_polynomials = self.__build_minimal_polynomials()
+        return self.__minimal_polynomials
+
+    def minimal_polynomial(self, exponent: int) -> np.ndarray:
+        '''
+        Minimal polynomial over GF(chr) of v^exponent
+        '''
+        return self.minimal_polynomials[int(self.coset_leaders[exponent % self.order])]
+
+    def minimal_polynomials_lcm(self, exponents) -> np.ndarray:
+        '''
+        LCM of minimal polynomials of v^e for e in exponents, that is
+        product of distinct ones (e.g. BCH generator for exponents 1..d-1)
+        '''
+        exponents = np.unique(np.asarray(exponents, dtype=np.int64) % self.order)
+
+        key = self.__key + (tuple(int(e) for e in exponents),)
+        if store.enabled(self.order):
+            stored = store.load('lcm', key, ('pol',))
+            if stored is not None:
+                return np.array(stored['pol'])
+
+        leaders = np.unique(self.coset_leaders[exponents])
+
+        result = np.ones(1, dtype=np.int64)
+        for leader in leaders:
+            result = np.convolve(result, self.minimal_polynomials[int(leader)]) % self.chr
+
+        if store.enabled(self.order):
+            store.save('lcm', key, {'pol': result})
+        return result
+
+    def array(self, values):
+        '''
+        Create GaluaArray of packed elements of this field
+        '''
+        from galua.GaluaArray import GaluaArray
+        return GaluaArray(self, values)
+
+    def __build_cosets(self):
+        if self.__cosets is not None:
+            return self.__cosets
+        if not self.is_primitive:
+            raise ValueError("Cyclotomic cosets need primitive polynomial of field")
+
+        n = self.order
+
+        # conjugates[j, i] = i * chr^j mod n
+        conjugates = np.zeros((self.orp, n), dtype=np.int64)
+        conjugates[0] = np.arange(n, dtype=np.int64)
+        for j in range(1, self.orp):
+            conjugates[j] = (conjugates[j - 1] * self.chr) % n
+
+        leaders = conjugates.min(axis=0)
+        leaders.flags.writeable = False
+
+        unique = np.flatnonzero(leaders == np.arange(n))
+        columns = conjugates[:, unique]
+
+        # coset size is first j > 0 with leader * chr^j = leader, orp otherwise
+        repeats = columns[1:] == columns[0]
+        sizes = np.where(repeats.any(axis=0), repeats.argmax(axis=0) + 1, self.orp)
+
+        cosets = tuple(columns[:size, i] for i, size in enumerate(sizes))
+        for coset in cosets:
+            coset.flags.writeable = False
+
+        self.__cosets = (leaders, cosets)
+        return self.__cosets
+
+    def __build_minimal_polynomials(self):
+        cosets = self.cyclotomic_cosets
+        sizes = np.array([len(coset) for coset in cosets])
+
+        result = {}
+
+        # product of (x - v^k) over coset, all cosets of same size at once
+        for size in np.unique(sizes):
+            group = [coset for coset in cosets if len(coset) == size]
+            roots = self.array(self.__exp[np.stack(group)])
+
+            coeffs = self.array(np.zeros((len(group), size + 1), dtype=np.int64))
+            coeffs[:, 0] = 1
+            for t in range(size):
+                shifted = self.array(np.zeros(coeffs.shape, dtype=np.int64))
+                shifted[:, 1:] = coeffs[:, :-1]
+                coeffs = shifted - roots[:, t:t + 1] * coeffs
+
+            # coefficients lie in GF(chr), so packed form equals the coefficient
+            packed = coeffs.packed.astype(np.int64)
+            if np.any(packed >= self.chr):
+                raise ValueError("Minimal polynomial is not over GF(chr)")
+
+            for coset, pol in zip(group, packed):
+                pol.flags.writeable = False
+                result[int(coset[0])] = pol
+
+        return dict(sorted(result.items()))
+
+    def __logarithm(self, value: int) -> int:
+        i = int(self.__log[value])
+        if i < 0:
+            raise ValueError("Element is not a power of v, check primitive polynomial")
+        return i
+
     def __str__(self):
         result = f"GF({self.pow} = {self.chr}^{self.orp})\n"
         for i, row in enumerate(self.values, 0):
@@ -106,7 +544,14 @@ class GaluaField:
 
         return coefficient_prev % modulus
     
-    def __calculate_values(self):
+    @staticmethod
+    def __min_dtype(value, *dtypes):
+        for dtype in dtypes:
+            if value <= np.iinfo(dtype).max:
+                return dtype
+        raise ValueError("Field is too large")
+
+    def __calculate_powers(self):
 
         characteristic = self.chr
         extension_degree = self.orp
@@ -125,30 +570,129 @@ class GaluaField:
         normalized_lower_coefficients = (modulus_polynomial[:extension_degree] * inverse_leading_coefficient) % characteristic
         reduction_coefficients = (-normalized_lower_coefficients) % characteristic  # vector length extension_degree
 
-        values_table = np.zeros((self.pow, extension_degree), dtype=self.local_dtype)
-
-        # zero element
-        values_table[0, :] = 0
-
-        #x^0
-        current_element_coeffs = np.zeros(extension_degree, dtype=self.local_dtype)
-        current_element_coeffs[0] = 1
-
-        values_table[1, :] = current_element_coeffs
-
-        # generate powers of x
-        for _ in range(2, self.__pow):
-            overflow_coefficient = int(current_element_coeffs[-1])
-            # shift
-            shifted_coeffs = np.zeros(extension_degree, dtype=self.local_dtype)
-            shifted_coeffs[1:] = current_element_coeffs[:-1]
-
-            if overflow_coefficient != 0:
-                # reduce power overflow
-                shifted_coeffs = (shifted_coeffs + (overflow_coefficient * reduction_coefficients) % characteristic) % characteristic
-
-            current_element_coeffs = shifted_coeffs
-            values_table[_ , :] = current_element_coeffs
+        # packed powers v^0, v^1, ..., v^(pow - 2)
+        if characteristic == 2:
+            powers = binary_powers(reduction_coefficients, extension_degree, self.__pow - 1)
+        else:
+            powers = self.__modular_powers(reduction_coefficients, self.__pow - 1)
+
+        self.__powers = powers
+
+    def __load_tables(self, chr, orp, pol):
+        if not store.enabled(self.__pow):
+            return False
+
+        tables = store.load('field', self.__make_key(chr, orp, pol), ('powers', 'log', 'order'))
+        if tables is None:
+            return False
+
+        self.__powers = tables['powers']
+        self.__log = tables['log']
+        self.__order = int(tables['order'][0])
+        self.__exp = self.__powers[:self.__order]
+        return True
+
+    def __save_tables(self, chr, orp, pol):
+        if store.enabled(self.__pow):
+            store.save('field', self.__make_key(chr, orp, pol), {
+                'powers': self.__powers,
+                'log': self.__log,
+                'order': np.array([self.__order], dtype=np.int64),
+            })
+
+    def __build_values(self):
+        powers = self.__powers[:, np.newaxis]
+
+        values_table = np.zeros((self.pow, self.orp), dtype=self.local_dtype)
+        if self.chr == 2:
+            values_table[1:, :] = (powers >> np.arange(self.orp, dtype=powers.dtype)) & 1
+        else:
+            values_table[1:, :] = (powers.astype(np.int64) // self.__weights) % self.chr
 
-        self.__values = values_table
+        values_table.flags.writeable = False
+        return values_table
 
+    def __modular_powers(self, reduction_coefficients, count):
+        '''
+        Powers of v by doubling: block v^[k, 2k) is block v^[0, k) times v^k,
+        multiplication by v^k is a (orp x orp) matrix over GF(chr)
+        '''
+        characteristic = self.chr
+        extension_degree = self.orp
+        reduction = reduction_coefficients.astype(np.int64)
+
+        def shift(coeffs):
+            # multiply by v and reduce power overflow
+            shifted = np.zeros(extension_degree, dtype=np.int32)
+            shifted[1:] = coeffs[:-1]
+            return (shifted + coeffs[-1] * reduction) % characteristic
+
+        # coefficients are below chr, so int32 can hold the row by basis products
+        reduction = reduction.astype(np.int32)
+        rows = np.zeros((count, extension_degree), dtype=np.int32)
+        rows[0, 0] = 1
+
+        done = 1
+        while done < count:
+            # basis[j] is v^(done + j)
+            basis = np.zeros((extension_degree, extension_degree), dtype=np.int32)
+            current = shift(rows[done - 1])
+            for j in range(extension_degree):
+                basis[j] = current
+                current = shift(current)
+
+            size = min(done, count - done)
+            rows[done:done + size] = (rows[:size] @ basis) % characteristic
+            done += size
+
+        return (rows @ self.__weights).astype(self.__packed_dtype)
+
+    def __calculate_tables(self):
+
+        exp_table = self.__powers
+
+        # for non primitive pol powers of v repeat (or vanish) earlier than pow - 1
+        repeats = np.nonzero((exp_table[1:] == 1) | (exp_table[1:] == 0))[0]
+        self.__order = int(repeats[0]) + 1 if repeats.size > 0 else self.__pow - 1
+        self.__exp = exp_table[:self.__order]
+
+        # signed, -1 marks zero and elements which are not powers of v
+        log_dtype = self.__min_dtype(self.__order, np.int16, np.int32, np.int64)
+        self.__log = np.full(self.__pow, -1, dtype=log_dtype)
+        self.__log[self.__exp] = np.arange(self.__order, dtype=log_dtype)
+
+    def __build_add_table(self):
+        if not self.has_tables:
+            raise ValueError(f"Tables are supported only for pow <= {self.small_pow}")
+
+        a = np.arange(self.pow, dtype=np.int64)[:, np.newaxis]
+        b = np.arange(self.pow, dtype=np.int64)[np.newaxis, :]
+
+        table = np.zeros((self.pow, self.pow), dtype=np.int64)
+        for weight in self.__weights:
+            table += ((a // weight + b // weight) % self.chr) * weight
+
+        table = table.astype(np.uint8)
+        table.flags.writeable = False
+        return table
+
+    def __solve_table(self, table, value):
+        # solve[a] is first b with table[a, b] == value
+        solve = np.argmax(table == value, axis=1).astype(np.uint8)
+        solve.flags.writeable = False
+        return solve
+
+    def __build_mul_table(self):
+        if not self.has_tables:
+            raise ValueError(f"Tables are supported only for pow <= {self.small_pow}")
+        if self.order != self.pow - 1:
+            raise ValueError("Multiplication needs primitive polynomial of field")
+
+        log = self.__log.astype(np.int64)
+        table = self.__exp[(log[:, np.newaxis] + log[np.newaxis, :]) % self.order]
+        table[0, :] = 0
+        table[:, 0] = 0
+
+        table = table.astype(np.uint8)
+        table.flags.writeable = False
+        return table
@@ -1,5 +1,9 @@
-from galua.GaluaField import GaluaField as gf
+from galua.GaluaField import GaluaField as gf, binary_powers
 from galua.GaluaElement import GaluaElement as el
+from galua.GaluaArray import GaluaArray
+from galua.BinaryField import BinaryField
+from galua.polynomials import is_irreducible, is_primitive, primitive_polynomial
+from galua import store
 import numpy as np
 
 def run_all_tests():
@@ -17,6 +21,28 @@ def run_all_tests():
 
     check_unique()
 
+    check_inverse_power()
+
+    check_log_tables()
+
+    check_array()
+
+    check_tables()
+
+    check_interning()
+
+    check_power_tables()
+
+    check_compact_tables()
+
+    check_polynomials()
+
+    check_minimal_polynomials()
+
+    check_binary_field()
+
+    check_store()
+
 
 
 def check_add_sub():
@@ -46,9 +72,9 @@ def check_field(field: gf):
     one[0] = 1
     assert np.array_equal(field.values[1], one)
 
-    # uniqueness of all nonzero elements
-    uniq_nonzero = np.unique(field.values[1:], axis=0)
-    assert uniq_nonzero.shape[0] == field.pow - 1, "Nonzero elements must be unique; check irreducible/primitive polynomial."
+    # all nonzero elements are distinct powers of v
+    assert field.is_primitive, "Nonzero elements must be unique; check irreducible/primitive polynomial."
+    assert is_primitive(field.chr, field.pol)
     print(f"Checks passed for GF({field.chr}^{field.orp})")
 
 
@@ -102,5 +128,310 @@ def check_unique():
     assert np.all(un2.size == gf2.values.size)
 
     print("Checks passed for unique elements")
-    
-    
+
+
+def check_inverse_power():
+    gf1 = gf(3, 2, np.array([2, 2, 1]))
+
+    one = el(gf1, np.array([1, 0]))
+
+    for i in range(1, gf1.pow):
+        el1 = el(gf1, gf1.values[i])
+
+        assert el1 * el1.inverse() == one
+        assert el1 ** (gf1.pow - 1) == one
+        assert el1 ** 2 == el1 * el1
+
+    print("Checks passed for inverse and power")
+
+
+def check_log_tables():
+    gf1 = gf(2, 4, np.array([1, 1, 0, 0, 1]))
+
+    # reference: polynomial product reduced by pol
+    def reference(a, b):
+        prod = np.convolve(a, b) % gf1.chr
+        for d in range(prod.size - 1, gf1.orp - 1, -1):
+            prod[d - gf1.orp:d + 1] = (prod[d - gf1.orp:d + 1] - prod[d] * gf1.pol) % gf1.chr
+        return prod[:gf1.orp]
+
+    for a in range(gf1.pow):
+        for b in range(gf1.pow):
+            va, vb = gf1.to_vector(a), gf1.to_vector(b)
+            assert np.all(gf1.to_vector(gf1.mul(a, b)) == reference(va, vb))
+
+    assert np.all(gf1.log[gf1.exp] == np.arange(gf1.order))
+    assert gf1.order == gf1.pow - 1
+
+    print("Checks passed for log tables")
+
+
+def check_array():
+    gf1 = gf(3, 2, np.array([2, 2, 1]))
+
+    # all pairs of elements via broadcasting
+    a = gf1.array(np.arange(gf1.pow)[:, np.newaxis])
+    b = gf1.array(np.arange(gf1.pow)[np.newaxis, :])
+
+    add, sub, mul = a + b, a - b, a * b
+
+    for i in range(gf1.pow):
+        for j in range(gf1.pow):
+            el1 = el.from_int(gf1, i)
+            el2 = el.from_int(gf1, j)
+            assert add.packed[i, j] == (el1 + el2).packed
+            assert sub.packed[i, j] == (el1 - el2).packed
+            assert mul.packed[i, j] == (el1 * el2).packed
+
+    nonzero = gf1.array(np.arange(1, gf1.pow))
+    assert np.all((nonzero * nonzero.inverse()) == 1)
+    assert np.all((nonzero / nonzero) == 1)
+    assert np.all((nonzero ** 3) == nonzero * nonzero * nonzero)
+
+    # exponents beyond int64 are reduced by field order, zero stays zero
+    gf2 = gf(2, 4, np.array([1, 1, 0, 0, 1]))
+    elements = gf2.array(np.arange(gf2.pow))
+    assert np.all((elements ** (3 ** 40)) == elements ** ((3 ** 40) % gf2.order))
+    assert np.all((elements[1:] ** -(2 ** 62 + 1)) == (elements[1:] ** (2 ** 62 + 1)).inverse())
+    assert np.all((elements ** 0) == 1)
+
+    # matrix product against sum of elementwise products
+    rng = np.random.default_rng(5)
+    A = gf1.array(rng.integers(0, gf1.pow, size=(4, 6)))
+    B = gf1.array(rng.integers(0, gf1.pow, size=(6, 3)))
+    C = A @ B
+    for i in range(4):
+        for j in range(3):
+            assert C.packed[i, j] == (A[i, :] * B[:, j]).sum().packed
+    assert np.all((A @ B[:, 0]) == C[:, 0])
+
+    # table kernels give the same packed dtype as the other paths
+    for packed in (C.packed, (A + A).packed, (A * A).packed):
+        assert packed.dtype == np.int64
+
+    vectors = A.to_vectors()
+    assert np.all(GaluaArray.from_vectors(gf1, vectors) == A)
+
+    print("Checks passed for arrays")
+
+
+def check_tables():
+    gf1 = gf(2, 4, np.array([1, 1, 0, 0, 1]))
+    gf2 = gf(3, 2, np.array([2, 2, 1]))
+
+    for field in (gf1, gf2):
+        for a in range(field.pow):
+            for b in range(field.pow):
+                ea, eb = el.from_int(field, a), el.from_int(field, b)
+                assert field.add_table[a, b] == (ea + eb).packed
+                assert field.mul_table[a, b] == field.mul(a, b)
+
+        assert np.all(field.add_table[np.arange(field.pow), field.neg_table] == 0)
+        assert np.all(field.mul_table[np.arange(1, field.pow), field.inv_table[1:]] == 1)
+        # neg/inv tables are built once with add/mul tables
+        assert field.neg_table is field.neg_table and field.inv_table is field.inv_table
+
+        rng = np.random.default_rng(3)
+        A = rng.integers(0, field.pow, size=(5, 7))
+        x = rng.integers(0, field.pow, size=(4, 7))
+
+        y = field.table_matvec(A, x)
+        for i in range(4):
+            for j in range(5):
+                expected = el.from_int(field, 0)
+                for t in range(7):
+                    expected = expected + el.from_int(field, int(A[j, t])) * el.from_int(field, int(x[i, t]))
+                assert y[i, j] == expected.packed
+
+    try:
+        gf(2, 9, np.array([1, 0, 0, 0, 1, 0, 0, 0, 0, 1])).add_table
+        assert False, "Tables must be limited to small fields"
+    except ValueError:
+        pass
+
+    print("Checks passed for small field tables")
+
+
+def check_interning():
+    gf.cache_clear()
+
+    gf1 = gf(2, 3, [1, 0, 1, 1])
+    gf2 = gf(2, 3, np.array([1, 0, 1, 1]))
+
+    assert gf1 is gf2
+    assert gf1 == gf2 and hash(gf1) == hash(gf2)
+    assert not gf1.values.flags.writeable
+
+    # bounded cache evicts least recently used fields
+    cache_size = gf.cache_size
+    gf.cache_size = 2
+    try:
+        gf(3, 2, [2, 2, 1])
+        gf(2, 4, [1, 1, 0, 0, 1])
+
+        assert gf(2, 3, [1, 0, 1, 1]) is not gf1
+        assert gf(2, 3, [1, 0, 1, 1]) == gf1
+    finally:
+        gf.cache_size = cache_size
+
+    try:
+        gf(2.0, 3, [1, 0, 1, 1])
+        assert False
+    except ValueError:
+        pass
+
+    print("Checks passed for interning")
+
+
+def check_power_tables():
+    # every row is previous one multiplied by v and reduced by pol
+    for field in (gf(2, 8, [1, 0, 1, 1, 1, 0, 0, 0, 1]), gf(3, 3, [1, 2, 0, 1])):
+        rows = field.values[1:].astype(np.int64)
+        reduction = (-field.pol[:-1]) % field.chr
+
+        shifted = np.zeros_like(rows)
+        shifted[:, 1:] = rows[:, :-1]
+        shifted = (shifted + rows[:, -1:] * reduction) % field.chr
+
+        assert np.array_equal(shifted[:-1], rows[1:])
+        assert field.order == field.pow - 1
+
+    # binary powers are built from pol alone
+    pol = [1, 0, 1, 1, 1, 0, 0, 0, 1]
+    powers = binary_powers(pol, 8)
+    assert powers.dtype == np.uint8
+    assert np.array_equal(powers, gf(2, 8, pol).values[1:].astype(np.int64) @ (1 << np.arange(8)))
+
+    print("Checks passed for power tables")
+
+
+def check_compact_tables():
+    field = gf(2, 16, [1, 0, 1, 1, 0, 1] + [0] * 10 + [1])
+
+    assert field.packed_dtype == np.uint16
+    assert field.exp.dtype == np.uint16 and field.log.dtype == np.int32
+
+    # coefficients view agrees with packed powers
+    rows = np.array([1, 2, 100, field.pow - 1])
+    assert np.array_equal(field.values[rows] @ (2 ** np.arange(16)), field.exp[rows - 1])
+    assert not field.values.flags.writeable
+
+    small = gf(3, 2, [2, 2, 1])
+    a = small.array([1, 2, 3, 4, 5]) * small.array([2, 3, 4, 5, 6])
+    assert np.all((a - a).packed == 0)
+
+    print("Checks passed for compact tables")
+
+
+def check_polynomials():
+    # x^2 + 1 over GF(3) is irreducible, but v has order 4
+    assert is_irreducible(3, [1, 0, 1]) and not is_primitive(3, [1, 0, 1])
+    assert not is_irreducible(2, [1, 0, 1])
+    assert is_primitive(2, [1, 1, 0, 0, 1])
+
+    # field is built only on primitive pol
+    for pol in ([1, 1, 0, 0, 1], [1, 0, 0, 1, 1]):
+        assert gf(2, 4, pol).is_primitive
+    for chr, orp, pol in ((2, 4, [1, 1, 1, 1, 1]), (3, 2, [1, 0, 1]), (5, 2, [1, 0, 1])):
+        try:
+            gf(chr, orp, pol)
+            assert False
+        except ValueError:
+            pass
+
+    for chr, orp in ((2, 8), (3, 5), (5, 7), (7, 3)):
+        pol = primitive_polynomial(chr, orp)
+        assert len(pol) == orp + 1 and pol[-1] == 1
+        assert is_primitive(chr, pol)
+
+    assert gf.primitive(3, 3).is_primitive
+
+    print("Checks passed for primitive polynomials")
+
+
+def check_minimal_polynomials():
+    field = gf(2, 4, [1, 1, 0, 0, 1])
+
+    cosets = [list(coset) for coset in field.cyclotomic_cosets]
+    assert cosets == [[0], [1, 2, 4, 8], [3, 6, 12, 9], [5, 10], [7, 14, 13, 11]]
+    assert field.coset_leaders[13] == 7
+
+    assert list(field.minimal_polynomial(2)) == [1, 1, 0, 0, 1]
+    assert list(field.minimal_polynomial(6)) == [1, 1, 1, 1, 1]
+
+    # generator of BCH(15, 7): x^8 + x^7 + x^6 + x^4 + 1
+    assert list(field.minimal_polynomials_lcm([1, 2, 3, 4])) == [1, 0, 0, 0, 1, 0, 1, 1, 1]
+
+    # every element is a root of its minimal polynomial
+    field = gf(3, 2, [2, 2, 1])
+    for leader, pol in field.minimal_polynomials.items():
+        assert is_irreducible(3, list(pol))
+        root = field.array([field.exp[leader]])
+        value = sum(int(c) * root ** i for i, c in enumerate(pol))
+        assert value.packed[0] == 0
+
+    print("Checks passed for minimal polynomials")
+
+
+def check_binary_field():
+    # agrees with table field on GF(2^8)
+    pol = [1, 0, 1, 1, 1, 0, 0, 0, 1]
+    table_field = gf(2, 8, pol)
+    wide_field = BinaryField(8, pol)
+
+    a = np.arange(256)
+    b = np.roll(a, 7)
+    expected = [table_field.mul(int(x), int(y)) for x, y in zip(a, b)]
+    assert np.array_equal(wide_field.mul(a, b), expected)
+    assert np.array_equal(wide_field.inv(a[1:]), [table_field.inv(int(x)) for x in a[1:]])
+
+    # wide fields keep no tables
+    for orp in (32, 64):
+        field = BinaryField(orp)
+        x = np.random.default_rng(orp).integers(1, 2 ** 31, 1000, dtype=np.uint64)
+
+        assert np.all(field.mul(x, field.inv(x)) == 1)
+        assert np.array_equal(field.square(x), field.mul(x, x))
+        assert np.array_equal(field.power(x, 3), field.mul(x, field.square(x)))
+
+    try:
+        BinaryField(8, pol).mul([256], [1])
+        assert False
+    except ValueError:
+        pass
+
+    print("Checks passed for binary field")
+
+
+def check_store():
+    import os
+    import tempfile
+
+    previous = store.cache_dir()
+
+    with tempfile.TemporaryDirectory() as directory:
+        store.set_cache_dir(directory)
+        try:
+            gf.cache_clear()
+            built = gf.primitive(2, 13)
+            generator = built.minimal_polynomials_lcm(range(1, 5))
+            exp, log = np.array(built.exp), np.array(built.log)
+
+            # small fields are cheaper to rebuild and are not stored
+            gf(2, 3, [1, 1, 0, 1])
+            assert len(os.listdir(directory)) == 4
+
+            # second process start: tables are mapped from disk
+            gf.cache_clear()
+            loaded = gf.primitive(2, 13)
+            assert loaded is not built
+            assert isinstance(loaded.exp, np.memmap) and not loaded.exp.flags.writeable
+            assert np.array_equal(loaded.exp, exp) and np.array_equal(loaded.log, log)
+            assert loaded.order == built.order
+            assert loaded.mul(1234, 4321) == built.mul(1234, 4321)
+            assert np.array_equal(loaded.minimal_polynomials_lcm([4, 3, 2, 1]), generator)
+        finally:
+            store.set_cache_dir(previous)
+            gf.cache_clear()
+
+    print("Checks passed for store")
@@ -1,7 +1,11 @@
 from galua.GaluaField import GaluaField
 from galua.GaluaElement import GaluaElement
+from galua.GaluaArray import GaluaArray
+from galua.BinaryField import BinaryField
 
 __all__ = [
     'GaluaField',
-    'GaluaElement'
+    'GaluaElement',
+    'GaluaArray',
+    'BinaryField'
 ]
\ No newline at end of file
@@ -0,0 +1,273 @@
+import math
+import random
+
+from itertools import combinations, product
+
+
+'''
+Irreducibility and primitivity tests for polynomials over GF(chr) and
+search of lowest weight primitive polynomials.
+
+Polynomials are coefficient lists in GaluaField order: pol[i] is the
+coefficient of x^i, pol[-1] is the leading one.
+'''
+
+# (chr, orp) -> primitive pol, filled from primitive_table and by searches
+_cache = None
+
+
+def is_irreducible(chr: int, pol: list[int]) -> bool:
+    '''
+    Rabin test: pol of degree n is irreducible over GF(chr) iff
+    x^(chr^n) = x mod pol and gcd(x^(chr^(n/r)) - x, pol) = 1
+    for every prime r dividing n
+    '''
+    f = _monic(chr, pol)
+    n = len(f) - 1
+
+    if n < 1:
+        return False
+    if n == 1:
+        return True
+
+    # x^(chr^k) for k = 1..n in one pass, intermediate ones kept for gcd checks
+    checks = {n // r for r in _prime_factors(n)}
+    intermediate = []
+
+    h = [0, 1]
+    for k in range(1, n + 1):
+        h = _powmod(chr, h, chr, f)
+        if k in checks:
+            intermediate.append(h)
+
+    if h != [0, 1]:
+        return False
+
+    return all(len(_gcd(chr, _sub(chr, g, [0, 1]), f)) == 1 for g in intermediate)
+
+
+def is_primitive(chr: int, pol: list[int]) -> bool:
+    '''
+    pol is primitive iff it is irreducible and x has order chr^n - 1
+    modulo pol, checked on prime factors of chr^n - 1
+    '''
+    f = _monic(chr, pol)
+    n = len(f) - 1
+
+    if n < 1 or f[0] == 0 or not is_irreducible(chr, f):
+        return False
+
+    order = chr ** n - 1
+    for r in _prime_factors(order):
+        if _powmod(chr, [0, 1], order // r, f) == [1]:
+            return False
+
+    return True
+
+
+def primitive_polynomial(chr: int, orp: int) -> list[int]:
+    '''
+    Monic primitive polynomial of degree orp over GF(chr) with lowest
+    number of nonzero coefficients. Known answers come from primitive_table,
+    others are searched once and cached.
+    '''
+    if (not isinstance(chr, int)) or (not isinstance(orp, int)):
+        raise ValueError("Incorrect datatype")
+    if orp < 1 or not _is_prime(chr):
+        raise ValueError("chr must be prime and orp positive")
+
+    cache = _table()
+    key = (chr, orp)
+
+    if key not in cache:
+        cache[key] = _search(chr, orp)
+
+    return list(cache[key])
+
+
+def write_primitive_table(params, path: str = None):
+    '''
+    Regenerate primitive_table module for given (chr, orp) pairs
+    '''
+    if path is None:
+        path = __file__.replace('polynomials.py', 'primitive_table.py')
+
+    lines = [
+        "# Generated by galua.polynomials.write_primitive_table, do not edit.",
+        "# (chr, orp) -> lowest weight monic primitive pol, pol[i] is coefficient of x^i",
+        "",
+        "PRIMITIVE_POLYNOMIALS = {",
+    ]
+    for chr, orp in sorted(params):
+        lines.append(f"    ({chr}, {orp}): {primitive_polynomial(chr, orp)},")
+    lines.append("}")
+
+    with open(path, 'w') as file:
+        file.write("\n".join(lines) + "\n")
+
+
+def _table():
+    global _cache
+    if _cache is None:
+        from galua.primitive_table import PRIMITIVE_POLYNOMIALS
+        _cache = dict(PRIMITIVE_POLYNOMIALS)
+    return _cache
+
+
+def _search(chr: int, orp: int) -> list[int]:
+    # monic, nonzero constant term; fewer nonzero middle terms first
+    for middle_count in range(orp):
+        for positions in combinations(range(1, orp), middle_count):
+            for coeffs in product(range(1, chr), repeat=middle_count + 1):
+                pol = [0] * (orp + 1)
+                pol[-1] = 1
+                pol[0] = coeffs[0]
+                for position, coeff in zip(positions, coeffs[1:]):
+                    pol[position] = coeff
+
+                if is_primitive(chr, pol):
+                    return pol
+
+    raise ValueError("Primitive polynomial not found")
+
+
+# polynomial arithmetic over GF(chr), lists without trailing zeros
+
+def _trim(a):
+    while a and a[-1] == 0:
+        a.pop()
+    return a
+
+
+def _monic(chr, pol):
+    f = _trim([int(c) % chr for c in pol])
+    if not f:
+        return f
+    inverse = pow(f[-1], -1, chr)
+    return [(c * inverse) % chr for c in f]
+
+
+def _sub(chr, a, b):
+    result = [0] * max(len(a), len(b))
+    for i, c in enumerate(a):
+        result[i] = c
+    for i, c in enumerate(b):
+        result[i] = (result[i] - c) % chr
+    return _trim(result)
+
+
+def _mod(chr, a, f):
+    # f is monic
+    a = list(a)
+    n = len(f) - 1
+    for i in range(len(a) - 1, n - 1, -1):
+        c = a[i]
+        if c:
+            for j in range(n + 1):
+                a[i - n + j] = (a[i - n + j] - c * f[j]) % chr
+    return _trim(a[:n])
+
+
+def _mulmod(chr, a, b, f):
+    if not a or not b:
+        return []
+    result = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                result[i + j] += x * y
+    return _mod(chr, [c % chr for c in result], f)
+
+
+def _powmod(chr, a, exponent, f):
+    result = [1]
+    base = _mod(chr, a, f)
+    while exponent:
+        if exponent & 1:
+            result = _mulmod(chr, result, base, f)
+        base = _mulmod(chr, base, base, f)
+        exponent >>= 1
+    return result
+
+
+def _gcd(chr, a, b):
+    a, b = _trim(list(a)), _trim(list(b))
+    while b:
+        b_monic = _monic(chr, b)
+        a, b = b_monic, _mod(chr, a, b_monic)
+    return a
+
+
+# integer factorization for chr^n - 1
+
+def _is_prime(n: int) -> bool:
+    if n < 2:
+        return False
+    for p in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41):
+        if n % p == 0:
+            return n == p
+
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+
+    # deterministic for n < 3.3 * 10^24, probabilistic above
+    for a in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41):
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = pow(x, 2, n)
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _pollard_brent(n: int) -> int:
+    if n % 2 == 0:
+        return 2
+    rng = random.Random(n)
+    while True:
+        y, c, m = rng.randrange(1, n), rng.randrange(1, n), 128
+        g, r, q = 1, 1, 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+
+def _prime_factors(n: int) -> set[int]:
+    factors = set()
+    for p in (2, 3, 5, 7, 11, 13):
+        while n % p == 0:
+            factors.add(p)
+            n //= p
+
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if _is_prime(m):
+            factors.add(m)
+        else:
+            d = _pollard_brent(m)
+            stack.extend((d, m // d))
+
+    return factors
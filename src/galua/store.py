@@ -0,0 +1,82 @@
+import hashlib
+import os
+
+import numpy as np
+
+
+'''
+Opt-in on-disk store of construction artifacts: field tables, code
+matrices, syndrome tables and generator polynomials as .npy files.
+Disabled until a directory is given by set_cache_dir or GALUA_CACHE_DIR.
+
+Entries are keyed by hash of kind and construction parameters and are
+loaded memory-mapped read-only, so restarted processes skip the build
+and share pages through the OS page cache.
+'''
+
+# bump when layout of stored arrays changes
+_version = 1
+
+# artifacts with fewer elements are cheaper to build than to load
+min_size = 1 << 12
+
+_cache_dir = os.environ.get('GALUA_CACHE_DIR') or None
+
+
+def set_cache_dir(path: str | None):
+    '''
+    Enable store in directory path (created on first save), None disables
+    '''
+    global _cache_dir
+    _cache_dir = None if path is None else os.fspath(path)
+
+
+def cache_dir() -> str | None:
+    return _cache_dir
+
+
+def enabled(size: int) -> bool:
+    '''
+    Whether artifact of given number of elements goes through the store
+    '''
+    return _cache_dir is not None and size >= min_size
+
+
+def load(kind: str, params: tuple, names) -> dict[str, np.ndarray] | None:
+    '''
+    Return dict name -> read-only memory-mapped array, None if store is
+    disabled or any of the arrays is missing
+    '''
+    if _cache_dir is None:
+        return None
+
+    base = _entry_path(kind, params)
+    try:
+        return {name: np.load(f"{base}.{name}.npy", mmap_mode='r') for name in names}
+    except (OSError, ValueError):
+        return None
+
+
+def save(kind: str, params: tuple, arrays: dict[str, np.ndarray]):
+    '''
+    Store arrays of entry, each file is written to temporary name and
+    renamed, so concurrent workers never see partial files. Failures to
+    write leave the store unchanged and are not reported
+    '''
+    if _cache_dir is None:
+        return
+
+    base = _entry_path(kind, params)
+    try:
+        os.makedirs(_cache_dir, exist_ok=True)
+        for name, array in arrays.items():
+            temporary = f"{base}.{name}.{os.getpid()}.tmp.npy"
+            np.save(temporary, np.ascontiguousarray(array))
+            os.replace(temporary, f"{base}.{name}.npy")
+    except OSError:
+        pass
+
+
+def _entry_path(kind: str, params: tuple) -> str:
+    digest = hashlib.sha256(repr((_version, kind, params)).encode()).hexdigest()[:32]
+    return os.path.join(_cache_dir, f"{kind}-{digest}")
@@ -1,4 +1,5 @@
 from hamming.ThreadGenerator import ThreadGenerator
+from linalg.code_matrix import erasure_symbol
 import numpy as np
 
 
@@ -9,6 +10,7 @@ def run_all_tests():
     test_generate_data_thread_ternary_flip_changes()
     test_generate_data_thread_no_change_zero_probs()
     thread_words_generator_test()
+    test_generate_data_thread_numeric_erasures()
     print("All Generator tests passed")
 
 
@@ -99,3 +101,25 @@ def thread_words_generator_test():
     words = gen.generate_words_thread(5)
 
     assert np.all(words.shape == (5, 4))
+
+
+def test_generate_data_thread_numeric_erasures():
+    words = np.array([
+        [0, 1, 2, 0],
+        [2, 2, 1, 0]
+    ])
+    gen = ThreadGenerator(ThreadGenerator.make_base(3, with_erasure=True), 4, 2)
+
+    erased = gen.generate_data_thread(words, [0.0, 0.0], fixed_erasures_per_word=2)
+    assert erased.dtype == np.uint8
+    assert np.all(np.sum(erased == erasure_symbol, axis=1) == 2)
+
+    kept = erased != erasure_symbol
+    assert np.array_equal(erased[kept], words[kept])
+
+    # flips skip erasures, symbols round trip through 'z'
+    flipped = gen.generate_data_thread(erased, [1.0, 0.0])
+    assert np.array_equal(flipped == erasure_symbol, ~kept)
+    assert np.all(flipped[kept] != words[kept])
+    assert np.array_equal(gen.to_numeric(gen.to_symbols(flipped)), flipped)
+    assert np.array_equal(gen.to_symbols(erased) == 'z', ~kept)
@@ -1,5 +1,6 @@
 import numpy as np
 
+from linalg.code_matrix import erasure_symbol, split_erasures
 
 class ThreadGenerator:
 
@@ -11,7 +12,8 @@ class ThreadGenerator:
     def make_base(q: int, with_erasure: bool = False) -> list[str]:
         '''
         Build symbol alphabet for arbitrary q >= 2.
-        If with_erasure=True, appends 'z' symbol for erasures.
+        If with_erasure=True, appends 'z' symbol for erasures
+        (erasure_symbol in numeric words).
         '''
         if q < 2:
             raise ValueError("q must be >= 2")
@@ -37,6 +39,11 @@ class ThreadGenerator:
 
         self._q = len(self._digits)
 
+        # numeric words carry erasures as erasure_symbol
+        if 'z' in base and self._q > erasure_symbol:
+            raise ValueError(f"Erasures need q <= {erasure_symbol}")
+        self._dtype = np.uint8 if self._q <= erasure_symbol else np.int64
+
         self._n, self._k = code_length, base_length
 
 
@@ -59,160 +66,99 @@ class ThreadGenerator:
         
 
     def generate_data_thread(self, 
-        words_thread: np.ndarray[np.str_, np.str_],
+        words_thread: np.ndarray,
         awgn_params: list,
         one_error_per_word: bool = False,
         fixed_erasures_per_word: int | None = None
-    ) -> np.ndarray[np.str_, np.str_]:
+    ) -> np.ndarray:
         
         '''
-        Generate threads of data (nonclear) made by adding error with AWGN probability
+        Generate threads of data (nonclear) made by adding error with AWGN probability.
+        Numeric words come back as uint8 with erasure_symbol for erasures,
+        symbol words come back as symbols with 'z'
         '''
 
         if words_thread.size == 0:
             return words_thread
 
-        result = words_thread.copy().astype(np.str_)
+        symbolic = words_thread.dtype.kind in ('U', 'S')
+        result = self.to_numeric(words_thread) if symbolic else words_thread.astype(self._dtype)
 
-        # Optionally enforce a fixed number of erasures per word (uses 'z')
-        if fixed_erasures_per_word and 'z' in self.base:
-            rows, cols = result.shape
+        rows, cols = result.shape
+        with_erasure = 'z' in self.base
+
+        # Optionally enforce a fixed number of erasures per word
+        if fixed_erasures_per_word and with_erasure:
             e = max(0, min(int(fixed_erasures_per_word), cols))
             if e > 0:
-                for i in range(rows):
-                    # choose e distinct positions
-                    idxs = np.random.choice(cols, size=e, replace=False)
-                    result[i, idxs] = 'z'
+                # e distinct positions per word
+                idxs = np.argsort(np.random.rand(rows, cols), axis=1)[:, :e]
+                result[np.arange(rows)[:, np.newaxis], idxs] = erasure_symbol
+
+        erased = split_erasures(result, self._q)[1]
 
-        # Deterministic mode: flip exactly one symbol per word
+        # Deterministic mode: change exactly one non-erased symbol per word
         if one_error_per_word:
-            rows, cols = result.shape
-            rng_cols = np.random.randint(0, cols, size=rows)
-
-            if self._q == 2:
-                for i in range(rows):
-                    j = rng_cols[i]
-                    # ensure not erasure
-                    if result[i, j] == 'z':
-                        # pick next non-z position
-                        for jj in range(cols):
-                            if result[i, jj] != 'z':
-                                j = jj
-                                break
-                    result[i, j] = '1' if result[i, j] == '0' else '0'
-                return result
-
-            elif self._q == 3:
-                steps = np.random.randint(1, 3, size=rows)  # +1 or +2 mod 3
-                for i in range(rows):
-                    j = rng_cols[i]
-                    if result[i, j] == 'z':
-                        for jj in range(cols):
-                            if result[i, jj] != 'z':
-                                j = jj
-                                break
-                    # map char to int 0/1/2
-                    v = 0 if result[i, j] == self._digits[0] else (1 if result[i, j] == self._digits[1] else 2)
-                    v = (v + steps[i]) % 3
-                    result[i, j] = self._digits[v]
-                return result
-
-            elif self._q > 3:
-                steps = np.random.randint(1, self._q, size=rows)  # +step mod q
-                to_numeric = {s: i for i, s in enumerate(self._digits)}
-                for i in range(rows):
-                    j = rng_cols[i]
-                    if result[i, j] == 'z':
-                        for jj in range(cols):
-                            if result[i, jj] != 'z':
-                                j = jj
-                                break
-                    v = to_numeric[str(result[i, j])]
-                    v = (v + steps[i]) % self._q
-                    result[i, j] = self._digits[v]
-                return result
+            js = np.random.randint(0, cols, size=rows)
+            steps = np.random.randint(1, self._q, size=rows)  # +step mod q
+
+            # erased position moves to first non-erased one
+            hit = erased[np.arange(rows), js]
+            js = np.where(hit, np.argmax(~erased, axis=1), js)
+
+            rs = np.flatnonzero(~erased[np.arange(rows), js])
+            js = js[rs]
+            result[rs, js] = (result[rs, js] + steps[rs]) % self._q
+
+            return self.to_symbols(result) if symbolic else result
 
         # probabilities
         p_flip = float(awgn_params[0]) if len(awgn_params) >= 1 else 0.0
-        p_erase = float(awgn_params[1]) if (len(awgn_params) >= 2 and 'z' in self.base) else 0.0
-
-        rows, cols = result.shape
+        p_erase = float(awgn_params[1]) if (len(awgn_params) >= 2 and with_erasure) else 0.0
 
-        if 'z' in self.base and p_erase > 0.0:
+        if p_erase > 0.0:
             if p_erase >= 1.0:
                 erase_mask = np.ones((rows, cols), dtype=bool)
             else:
                 u_uniform = np.random.randn(rows, cols)
                 erase_mask = u_uniform < p_erase
-            result[erase_mask] = 'z'
+            result[erase_mask] = erasure_symbol
+            erased |= erase_mask
 
-        # flipping/errors for remaining symbols
-        if self._q == 2 and p_flip > 0.0:
+        # errors for remaining symbols
+        if p_flip > 0.0:
             if p_flip >= 1.0:
                 flip_mask = np.ones((rows, cols), dtype=bool)
             else:
                 u_uniform = np.random.randn(rows, cols)
                 flip_mask = u_uniform < p_flip
 
-            if 'z' in self.base:
-                # do not flip erased symbols
-                flip_mask &= (result != 'z')
-
-            # flip
-            zero_mask = (result == '0') & flip_mask
-            one_mask = (result == '1') & flip_mask
-            
-            result[zero_mask] = '1'
-            result[one_mask] = '0'
-
-        elif self._q == 3 and p_flip > 0.0:
-
-            # map to numeric indices 0,1,2
-            from_index = np.array(self._digits, dtype=np.str_)
-
-            numeric = np.zeros((rows, cols), dtype=np.int32)
-            numeric[result == '1'] = 1
-            numeric[result == '2'] = 2
+            # do not flip erased symbols
+            flip_mask &= ~erased
 
-            if p_flip >= 1.0:
-                flip_mask = np.ones((rows, cols), dtype=bool)
-            else:
-                u_uniform = np.random.randn(rows, cols)
-                flip_mask = u_uniform < p_flip
-
-            # choose +1 or +2 (mod 3)
-            step = np.random.randint(1, 3, size=(rows, cols))
-            numeric_new = (numeric + step) % 3
-            numeric[flip_mask] = numeric_new[flip_mask]
-
-            # map back to symbols
-            result = from_index[numeric]
-
-        elif self._q > 3 and p_flip > 0.0:
+            # choose +step (mod q) where step in {1..q-1}
+            step = np.random.randint(1, self._q, size=(rows, cols))
+            result[flip_mask] = (result[flip_mask] + step[flip_mask]) % self._q
 
-            # map to numeric indices 0..q-1
-            from_index = np.array(self._digits, dtype=np.str_)
-            to_numeric = {s: i for i, s in enumerate(self._digits)}
+        return self.to_symbols(result) if symbolic else result
 
-            numeric = np.zeros((rows, cols), dtype=np.int32)
-            for s, i in to_numeric.items():
-                numeric[result == s] = i
 
-            if p_flip >= 1.0:
-                flip_mask = np.ones((rows, cols), dtype=bool)
-            else:
-                u_uniform = np.random.randn(rows, cols)
-                flip_mask = u_uniform < p_flip
+    def to_numeric(self, words: np.ndarray) -> np.ndarray:
+        '''
+        Numeric words of symbol words, 'z' becomes erasure_symbol
+        '''
+        values, erased = split_erasures(words, self._q)
 
-            if 'z' in self.base:
-                flip_mask &= (result != 'z')
+        result = values.astype(self._dtype)
+        result[erased] = erasure_symbol
+        return result
 
-            # choose +step (mod q) where step in {1..q-1}
-            step = np.random.randint(1, self._q, size=(rows, cols))
-            numeric_new = (numeric + step) % self._q
-            numeric[flip_mask] = numeric_new[flip_mask]
 
-            # map back to symbols
-            result = from_index[numeric]
+    def to_symbols(self, words: np.ndarray) -> np.ndarray:
+        '''
+        Symbol words of numeric words, erasure_symbol becomes 'z'
+        '''
+        values, erased = split_erasures(words, self._q)
 
-        return result
\ No newline at end of file
+        symbols = np.array(self._digits + ['z'], dtype=np.str_)
+        return symbols[np.where(erased, self._q, values)]
@@ -0,0 +1,114 @@
+import numpy as np
+
+from collections import OrderedDict
+
+from galua import store
+from linalg.code_matrix import *
+
+class CodeSpec:
+    '''
+    Immutable construction artifacts of (n, k) Hamming code over gf:
+    parity-check matrix H, generator matrix G and syndrome table, all
+    read-only. Specs are interned by (n, k, chr, pol) like GaluaField, so
+    coder and decoder of a codec and later codecs with the same parameters
+    share one build. Shortened and extended codes derive their matrices
+    from these without copying. Large codes also go through galua.store.
+    '''
+
+    # least recently used specs are evicted
+    cache_size = 32
+    __instances = OrderedDict()
+
+    def __new__(cls, code_length: int, base_length: int, gf: GaluaField):
+
+        key = cls.__make_key(code_length, base_length, gf)
+        spec = cls.__instances.get(key)
+
+        if spec is not None:
+            cls.__instances.move_to_end(key)
+            return spec
+
+        return super().__new__(cls)
+
+    def __init__(self, code_length: int, base_length: int, gf: GaluaField):
+
+        # interned instance returned by __new__ is already built
+        if getattr(self, '_CodeSpec__key', None) is not None:
+            return
+
+        self.__code_length = code_length
+        self.__base_length = base_length
+        self.__exss_length = code_length - base_length
+        self.__gf = gf
+
+        key = self.__make_key(code_length, base_length, gf)
+        names = ('parity_check_matrix', 'generator_matrix', 'positions', 'magnitudes')
+
+        persistent = store.enabled(code_length * self.__exss_length)
+        tables = store.load('code', key, names) if persistent else None
+
+        if tables is None:
+            H = build_parity_check_matrix(code_length, self.__exss_length, gf)
+            tables = dict(zip(names, (
+                H, build_generator_matrix(H), *build_syndrome_table(H, gf.chr)
+            )))
+            if persistent:
+                store.save('code', key, tables)
+
+        self.__parity_check_matrix = tables['parity_check_matrix']
+        self.__generator_matrix = tables['generator_matrix']
+        self.__syndrome_table = (tables['positions'], tables['magnitudes'])
+
+        for table in (self.__parity_check_matrix, self.__generator_matrix, *self.__syndrome_table):
+            table.flags.writeable = False
+
+        self.__key = key
+        self.__intern()
+
+    @property
+    def code_length(self):
+        return self.__code_length
+
+    @property
+    def base_length(self):
+        return self.__base_length
+
+    @property
+    def exss_length(self):
+        return self.__exss_length
+
+    @property
+    def gf(self):
+        return self.__gf
+
+    @property
+    def parity_check_matrix(self):
+        return self.__parity_check_matrix
+
+    @property
+    def generator_matrix(self):
+        return self.__generator_matrix
+
+    @property
+    def syndrome_table(self):
+        '''
+        (positions, magnitudes) indexed by packed syndrome
+        '''
+        return self.__syndrome_table
+
+    @classmethod
+    def cache_clear(cls):
+        cls.__instances.clear()
+
+    @staticmethod
+    def __make_key(code_length, base_length, gf):
+        return (code_length, base_length, gf.chr, tuple(int(i) for i in gf.pol))
+
+    def __intern(self):
+        instances = CodeSpec.__instances
+
+        instances[self.__key] = self
+        instances.move_to_end(self.__key)
+
+        while len(instances) > self.cache_size:
+            instances.popitem(last=False)
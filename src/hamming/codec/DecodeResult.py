@@ -0,0 +1,58 @@
+import numpy as np
+
+class DecodeResult:
+    '''
+    Per word outcome of decoding a batch [m x n], filled by decoder from
+    arrays it computes anyway: syndromes of received words (erased symbols
+    as 0), status code, position and magnitude of applied correction
+    (received = corrected + magnitude at position, -1 and 0 if none).
+    Status code is index in statuses.
+    '''
+
+    statuses = ("clean", "corrected", "erasure_filled", "detected", "failed")
+
+    # zero syndrome, no erasures
+    CLEAN = 0
+    # single error corrected
+    CORRECTED = 1
+    # all erasures solved
+    ERASURE_FILLED = 2
+    # nonzero syndrome left uncorrected, e.g. double error of extended code
+    DETECTED = 3
+    # erasures could not be solved
+    FAILED = 4
+
+    def __init__(self,
+        syndromes: np.ndarray, status: np.ndarray,
+        positions: np.ndarray, magnitudes: np.ndarray
+    ):
+        self.__syndromes = syndromes
+        self.__status = status
+        self.__positions = positions
+        self.__magnitudes = magnitudes
+
+    @property
+    def syndromes(self):
+        return self.__syndromes
+
+    @property
+    def status(self):
+        return self.__status
+
+    @property
+    def positions(self):
+        return self.__positions
+
+    @property
+    def magnitudes(self):
+        return self.__magnitudes
+
+    def rows(self, status: str) -> np.ndarray:
+        '''
+        Indices of words with given status name
+        '''
+        return np.flatnonzero(self.__status == self.statuses.index(status))
+
+    def counts(self) -> dict[str, int]:
+        counts = np.bincount(self.__status, minlength=len(self.statuses))
+        return dict(zip(self.statuses, counts.tolist()))
@@ -4,7 +4,7 @@ from linalg.code_matrix import *
 
 class HammingCodec:
 
-    code_types = ["classic", "shortened", "extended"]
+    code_types = ["classic", "shortened", "extended", "implicit"]
 
     def __init__(self,
         code_type: str,
@@ -41,19 +41,71 @@ class HammingCodec:
             self.decoder = ShortenedDecoder(code_length, base_length, gf, short_code_length, short_base_length)
             self._short_n = code_length - short_code_length
             self._short_k = base_length - short_code_length
+
+        elif code_type == "implicit":
+            # full length code without H, G and syndrome table in memory
+            from .coder.ImplicitCoder import ImplicitCoder
+            from .decoder.ImplicitDecoder import ImplicitDecoder
+            self.coder = ImplicitCoder(code_length, base_length, gf)
+            self.decoder = ImplicitDecoder(code_length, base_length, gf)
         else:
             raise ValueError(f"Unsupported code_type: {code_type}")
 
+    @property
+    def spec(self):
+        '''
+        CodeSpec shared by coder and decoder, None for implicit codes
+        '''
+        return self.coder.spec
+
+    def packed(self):
+        '''
+        PackedCodec of this binary code, works on uint64 bitsets
+        '''
+        from .PackedCodec import PackedCodec
+
+        if self._gf.chr != 2:
+            raise ValueError("Packed codec needs binary code")
+        if self._type == "implicit":
+            raise ValueError("Implicit code has no matrices to pack")
+
+        G = self.coder.generator_matrix
+        H = self.coder.parity_check_matrix
+
+        if self._type == "extended":
+            # overall parity bit is sum of codeword
+            G = np.concatenate([G, G.sum(axis=1, keepdims=True) % 2], axis=1)
+            H = self.coder.extend_parity
+
+        return PackedCodec(G, H)
+
+    def lookup(self):
+        '''
+        LookupCodec of this tiny code, encodes and decodes by table gathers
+        '''
+        from .LookupCodec import LookupCodec
+
+        if self._type == "shortened":
+            return LookupCodec(self, self._short_k, self._short_n)
+        if self._type == "extended":
+            return LookupCodec(self, self._k, self._n + 1)
+
+        return LookupCodec(self, self._k, self._n)
+
     def encode(self, info_words: np.ndarray) -> np.ndarray:
         return self.coder.code_words(info_words.astype(int))
 
-    def decode(self, received: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    def decode(self, received: np.ndarray, return_result: bool = False) -> tuple:
         """
-        Returns (decoded_info, corrected_codewords)
+        Returns (decoded_info, corrected_codewords), with return_result
+        also DecodeResult with per word syndrome, status and correction
         """
-        corrected = self.decoder.detect_and_correct(received)
+        if return_result:
+            corrected, result = self.decoder.detect_and_correct(received, return_result=True)
+        else:
+            corrected = self.decoder.detect_and_correct(received)
 
-        if self._type == "classic":
+        if self._type in ("classic", "implicit"):
             info = corrected[:, :self._k]
         elif self._type == "extended":
             info = corrected[:, :self._k]  # parity bit last, discard
@@ -62,4 +114,6 @@ class HammingCodec:
         else:
             raise RuntimeError("Unknown codec type")
 
+        if return_result:
+            return info, corrected, result
         return info, corrected
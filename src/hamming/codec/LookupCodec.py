@@ -0,0 +1,100 @@
+import numpy as np
+
+from .DecodeResult import DecodeResult
+
+class LookupCodec:
+    '''
+    Exhaustive tables of tiny code: every codeword by info index and
+    decoding of every possible received word, so encoding and decoding
+    are single gathers without syndrome arithmetic. Words are indexed
+    as base q integers sum(w_j * q^j) like packed syndromes. Tables are
+    filled by encoding and decoding all words once with the given codec.
+    '''
+
+    # status of received word is DecodeResult code: CLEAN, CORRECTED or
+    # DETECTED for words left by decoder that are not codewords
+    statuses = DecodeResult.statuses
+
+    # table limits, q^k codewords and q^n received words
+    max_codewords = 1 << 16
+    max_received = 1 << 21
+
+    # received words decoded per block while building
+    block_size = 1 << 16
+
+    def __init__(self, codec, info_length: int, code_length: int):
+
+        q = codec.coder.gf.chr
+
+        if q ** info_length > self.max_codewords:
+            raise ValueError("Too many codewords for lookup table")
+        if q ** code_length > self.max_received:
+            raise ValueError("Too many received words for lookup table")
+
+        self.__chr = q
+        self.__info_length = info_length
+        self.__code_length = code_length
+
+        self.__weights = np.power(q, np.arange(code_length, dtype=np.int64))
+
+        self.__infos = self.__digits(np.arange(q ** info_length), info_length)
+        self.__codewords = codec.encode(self.__infos).astype(np.uint8)
+
+        total = q ** code_length
+        self.__decoded = np.empty(total, dtype=np.int32)
+        self.__status = np.empty(total, dtype=np.uint8)
+
+        for start in range(0, total, self.block_size):
+            indices = np.arange(start, min(start + self.block_size, total))
+            received = self.__digits(indices, code_length).astype(int)
+
+            info, corrected = codec.decode(received)
+            decoded = self.index(info)
+
+            valid = np.all(self.__codewords[decoded] == corrected, axis=1)
+            changed = np.any(corrected != received, axis=1)
+
+            self.__decoded[indices] = decoded
+            self.__status[indices] = np.where(
+                valid,
+                np.where(changed, DecodeResult.CORRECTED, DecodeResult.CLEAN),
+                DecodeResult.DETECTED
+            )
+
+        for table in (self.__infos, self.__codewords, self.__decoded, self.__status):
+            table.flags.writeable = False
+
+    @property
+    def info_length(self):
+        return self.__info_length
+
+    @property
+    def code_length(self):
+        return self.__code_length
+
+    def index(self, words: np.ndarray) -> np.ndarray:
+        '''
+        Base q indices of words [m x length] with symbols in 0..q-1
+        '''
+        words = np.asarray(words)
+        return words @ self.__weights[:words.shape[-1]]
+
+    def encode(self, info_words: np.ndarray) -> np.ndarray:
+        return self.__codewords[self.index(info_words)]
+
+    def decode_indices(self, indices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        Returns (info_indices, status) of received word indices
+        '''
+        return self.__decoded[indices], self.__status[indices]
+
+    def decode(self, received: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns (decoded_info, status)
+        """
+        decoded, status = self.decode_indices(self.index(received))
+        return self.__infos[decoded], status
+
+    def __digits(self, indices, length):
+        weights = self.__weights[:length]
+        return (indices[:, np.newaxis] // weights % self.__chr).astype(np.uint8)
@@ -0,0 +1,82 @@
+import numpy as np
+
+from linalg.code_matrix import build_syndrome_table
+from linalg.bit_packed import *
+
+class PackedCodec:
+    '''
+    Binary linear codec on bit-packed words (see linalg.bit_packed):
+    encoding xors generator rows selected by set information bits through
+    Four-Russians tables, one lookup per information byte,
+    syndromes are parities of popcount(word & H row), single errors are
+    corrected with xor masks through syndrome table. Built from any
+    binary G [k x n] and H [r x n], for systematic codes information is
+    first k bits of codeword.
+    '''
+
+    def __init__(self, generator_matrix: np.ndarray, parity_check_matrix: np.ndarray):
+
+        G = np.asarray(generator_matrix) % 2
+        H = np.asarray(parity_check_matrix) % 2
+
+        if G.shape[1] != H.shape[1]:
+            raise ValueError("G and H lengths differ")
+        if H.shape[0] > 63:
+            raise ValueError("Syndrome does not fit into int64")
+
+        self.__code_length = G.shape[1]
+        self.__base_length = G.shape[0]
+
+        self.__encoding_tables = build_encoding_tables(G)
+        self.__check_rows = pack_bits(H)
+        self.__positions, _ = build_syndrome_table(H, 2)
+
+        for table in (self.__encoding_tables, self.__check_rows, self.__positions):
+            table.flags.writeable = False
+
+    @property
+    def code_length(self):
+        return self.__code_length
+
+    @property
+    def base_length(self):
+        return self.__base_length
+
+    def encode(self, info: np.ndarray) -> np.ndarray:
+        '''
+        Packed codewords [m x ceil(n / 64)] of packed info words [m x ceil(k / 64)]
+        '''
+        info = np.ascontiguousarray(info, dtype='<u8')
+        return table_encode(info.view(np.uint8), self.__encoding_tables)
+
+    def syndromes(self, words: np.ndarray) -> np.ndarray:
+        return packed_syndromes(words, self.__check_rows)
+
+    def correct(self, words: np.ndarray) -> np.ndarray:
+        '''
+        Packed words with single errors corrected, others left as is
+        '''
+        corrected = np.array(words, dtype=np.uint64)
+
+        positions = self.__positions[self.syndromes(corrected)]
+        rows = np.flatnonzero(positions >= 0)
+        flip_bits(corrected, rows, positions[rows])
+
+        return corrected
+
+    def decode(self, words: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        Returns (decoded_info, corrected_codewords), both packed
+        '''
+        corrected = self.correct(words)
+        return self.info(corrected), corrected
+
+    def info(self, words: np.ndarray) -> np.ndarray:
+        '''
+        First k bits of packed words, packed
+        '''
+        k = self.base_length
+        info = np.array(words[:, :packed_width(k)], dtype=np.uint64)
+        if k % 64:
+            info[:, -1] &= np.uint64((1 << (k % 64)) - 1)
+        return info
@@ -11,4 +11,4 @@ class ClassicCoder(Coder):
 
     def code_words(self, words):
         
-        return words @ self.generator_matrix % self.gf.chr
\ No newline at end of file
+        return self._multiply(words)
\ No newline at end of file
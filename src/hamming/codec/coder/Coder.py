@@ -1,6 +1,9 @@
 import numpy as np
 
 from linalg.code_matrix import *
+from linalg.gf_linalg import gf_matmul
+from linalg.bit_packed import build_encoding_tables, binary_encode
+from ..CodeSpec import CodeSpec
 
 from abc import ABC, abstractmethod
 
@@ -12,12 +15,9 @@ class Coder(ABC):
         self.exss_length = code_length - base_length
         self.type = type
         self.gf = gf
+        self._encoding_tables = None
 
-        self.parity_check_matrix = build_parity_check_matrix(
-            self.code_length, self.exss_length, gf
-        )
-
-        self.generator_matrix = build_generator_matrix(self.parity_check_matrix)
+        self._build_matrices()
 
     @property 
     def code_length(self):
@@ -42,6 +42,10 @@ class Coder(ABC):
     @property 
     def gf(self):
         return self._gf
+
+    @property
+    def spec(self):
+        return self._spec
     
     @code_length.setter
     def code_length(self, value):
@@ -62,11 +66,34 @@ class Coder(ABC):
     @generator_matrix.setter
     def generator_matrix(self, value):
         self._generator_matrix = value
+        self._encoding_tables = None
 
     @gf.setter
     def gf(self, value):
         self._gf = value
 
+    def _build_matrices(self):
+        '''
+        H and G of the code, shared read-only with decoder and other codecs
+        '''
+        self._spec = CodeSpec(self.code_length, self.base_length, self.gf)
+
+        self.parity_check_matrix = self.spec.parity_check_matrix
+        self.generator_matrix = self.spec.generator_matrix
+
+    def _multiply(self, words: np.ndarray) -> np.ndarray:
+        '''
+        words @ G over gf, binary G goes through Four-Russians tables
+        built on first use
+        '''
+        if self.gf.chr != 2:
+            return gf_matmul(words, self.generator_matrix, self.gf.chr)
+
+        if self._encoding_tables is None:
+            self._encoding_tables = build_encoding_tables(self.generator_matrix)
+
+        return binary_encode(words, self._encoding_tables, self.generator_matrix.shape[1]).astype(int)
+
     
     @abstractmethod
     def code_words(self, words: np.ndarray): pass
@@ -24,7 +24,7 @@ class ExtendedCoder(Coder):
 
     def code_words(self, words):
 
-        result = words @ self.generator_matrix % self.gf.chr
+        result = self._multiply(words)
         even_bits = np.sum(result, axis=1) % self.gf.chr
         even_bits = even_bits[:, np.newaxis]
 
@@ -0,0 +1,38 @@
+import numpy as np
+
+from .Coder import *
+
+class ImplicitCoder(Coder):
+    '''
+    Full length Hamming coder over implicit layout of linalg.code_matrix,
+    parity symbols -A d are accumulated over blocks of generated columns,
+    H and G are built only when requested
+    '''
+
+    block_size = 1 << 12
+
+    def __init__(self,
+        code_length: int, base_length: int, gf: GaluaField
+    ):
+        if implicit_code_length(code_length - base_length, gf.chr) != code_length:
+            raise ValueError("Implicit code must have length (q^r - 1) / (q - 1)")
+
+        super().__init__(code_length, base_length, gf)
+
+    def _build_matrices(self):
+        # no spec, matrices are generated from columns on request
+        self._spec = None
+
+    @property
+    def parity_check_matrix(self):
+        return implicit_columns(np.arange(self.code_length), self.exss_length, self.gf.chr)
+
+    @property
+    def generator_matrix(self):
+        return build_generator_matrix(self.parity_check_matrix)
+
+    def code_words(self, words):
+        q = self.gf.chr
+        parity = implicit_syndromes(words, self.exss_length, q, self.block_size)
+
+        return np.concatenate([words % q, (-parity) % q], axis=1)
@@ -26,11 +26,11 @@ class ShortenedCoder(Coder):
         ]
 
 
-        HGt = self.parity_check_matrix @ self.generator_matrix.T % self.gf.chr
+        HGt = gf_matmul(self.parity_check_matrix, self.generator_matrix.T, self.gf.chr)
 
         if not np.all(HGt == 0):
             raise ValueError("matrix ortoghonal error")
     
 
     def code_words(self, words):
-        return words @ self.generator_matrix % self.gf.chr
\ No newline at end of file
+        return self._multiply(words)
\ No newline at end of file
@@ -9,6 +9,7 @@ def run_all_tests():
     classic_check()
     extended_check()
     shortened_check()
+    table_encoder_check()
     print("All Coder tests passed")
 
 def classic_check():
@@ -101,4 +102,27 @@ def shortened_check():
         [0, 0, 1, 1, 1, 0]
     ])
     
-    assert np.all(coded_words == true_coded_words)
\ No newline at end of file
+    assert np.all(coded_words == true_coded_words)
+
+
+def table_encoder_check():
+
+    # binary coders encode through Four-Russians tables, k not multiple of 8
+    gf = GaluaField.primitive(2, 8)
+    rng = np.random.default_rng(21)
+
+    for coder in (
+        ClassicCoder(255, 247, gf),
+        ExtendedCoder(255, 247, gf),
+        ShortenedCoder(255, 247, gf, 100, 92),
+    ):
+        G = coder.generator_matrix
+        words = rng.integers(0, 2, (50, G.shape[0]))
+        coded_words = coder.code_words(words)
+
+        assert np.all(coded_words[:, :G.shape[1]] == gf_matmul(words, G, 2))
+
+    # single word keeps its shape like gf_matmul
+    coder = ClassicCoder(255, 247, gf)
+    word = rng.integers(0, 2, 247)
+    assert np.all(coder.code_words(word) == gf_matmul(word, coder.generator_matrix, 2))
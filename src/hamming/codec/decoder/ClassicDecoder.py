@@ -1,13 +1,17 @@
 import numpy as np
 
+from linalg.gf_linalg import gf_matmul
+from linalg.bit_sliced import slice_bits, unslice_bits, sliced_correct
 from .Decoder import *
 
 class ClassicDecoder(Decoder):
 
     def __init__(self,
-        code_length: int, base_length: int, gf: GaluaField
+        code_length: int, base_length: int, gf: GaluaField,
+        backend: str = "table"
     ):
         super().__init__(code_length, base_length, gf)
+        self.backend = backend
 
 
     def find_errors(self, words: np.ndarray):
@@ -18,74 +22,39 @@ class ClassicDecoder(Decoder):
         q = self.gf.chr
 
         # words expected shape: [m, n]
-        syndromes = (H @ words.T) % q
+        syndromes = gf_matmul(H, words.T, q)
         return syndromes.T
 
 
-    def detect_and_correct(self, words: np.ndarray): 
+    def detect_and_correct(self, words: np.ndarray, return_result: bool = False):
+        '''
+        Corrected words, with return_result also their DecodeResult
+        (computed by table backend)
+        '''
         if words.size == 0:
-            return words
-
-        # Support both numeric arrays and symbol arrays with 'z' for erasures
-        if words.dtype.type is np.str_ or words.dtype.kind in ('U', 'S'):
-            sym = words
-            corrected = np.zeros(sym.shape, dtype=int)
-            # decode row-wise with erasures
-            H = self.parity_check_matrix
-            q = self.gf.chr
-            for i in range(sym.shape[0]):
-                row = sym[i]
-                er_mask = (row == 'z')
-
-                known_int = np.zeros(row.shape, dtype=int)
-                known_int[~er_mask] = np.array([int(c) for c in row[~er_mask]], dtype=int)
-                s = (H @ known_int) % q
-                if np.any(er_mask):
-                    from linalg.code_matrix import solve_linear_mod
-                    A = H[:, er_mask]
-                    b = (-s) % q
-                    x, ok = solve_linear_mod(A, b, q)
-                    if ok:
-                        fill = known_int.copy()
-                        fill[er_mask] = x
-                        corrected[i] = fill % q
-                        continue
-
-                y = known_int.copy()
-                s = (H @ y) % q
-                if np.all(s == 0):
-                    corrected[i] = y
-                    continue
-                from linalg.code_matrix import find_error_with_scalar
-                j, a = find_error_with_scalar(s, H, q)
-                if j is not None and a is not None:
-                    y[j] = (y[j] - a) % q
-                corrected[i] = y
-            return corrected
-
-        corrected = words.copy()
-        H = self.parity_check_matrix
+            return (words, self.empty_result()) if return_result else words
+
         q = self.gf.chr
 
-        # row-wise correction
-        for i in range(corrected.shape[0]):
-            y = corrected[i]
-            s = (H @ y) % q
+        # numeric words with erasure_symbol or symbol arrays with 'z'
+        values, erased = split_erasures(words, q)
 
-            # zero syndrome -> no error
-            if np.all(s == 0):
-                continue
+        if self.backend == "bitslice" and not return_result and not np.any(erased):
+            planes = sliced_correct(slice_bits(values), self.parity_check_matrix)
+            return unslice_bits(planes, words.shape[0]).astype(int)
 
-            # General GF(q): find j
-            from linalg.code_matrix import find_error_with_scalar
-            j, a = find_error_with_scalar(s, H, q)
-            if j is not None and a is not None:
-                corrected[i, j] = (corrected[i, j] - a) % q
+        syndromes = self.find_errors(values)
+        solved = self.fill_erasures(values, erased, syndromes)
 
-        return corrected
+        # syndrome table gives (position, magnitude), zero syndrome -> position -1,
+        # unsolved erasures stay 0 and the word gets single error correction
+        positions, magnitudes = self.locate_errors(syndromes)
+        applied = (positions >= 0) & ~solved
+        rows = np.flatnonzero(applied)
+        cols = positions[rows]
 
+        values[rows, cols] = (values[rows, cols] - magnitudes[rows]) % q
 
-    def find_erasures(self, words: np.ndarray):
-        if words.dtype.type is np.str_ or words.dtype.kind in ('U', 'S'):
-            return words == 'z'
-        return np.zeros_like(words, dtype=bool)
\ No newline at end of file
+        if return_result:
+            return values, self.decode_result(syndromes, erased, solved, applied, positions, magnitudes)
+        return values
@@ -1,22 +1,33 @@
 import numpy as np
 
 from linalg.code_matrix import *
+from linalg.gf_linalg import factor_solver, gf_matmul
+from linalg.bit_packed import pack_bits
+from ..CodeSpec import CodeSpec
+from ..DecodeResult import DecodeResult
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 
 class Decoder(ABC):
 
+    # "table" looks syndromes up per word, "bitslice" decides corrections
+    # for 64 binary words at once on bit planes
+    backends = ("table", "bitslice")
+
+    # factored erasure solvers kept per decoder, least recently used evicted
+    solver_cache_size = 256
+
     def __init__(self, code_length: int, base_length: int, gf: GaluaField):
         self._code_length = code_length
         self._base_length = base_length
         self._exss_length = code_length - base_length
         self._gf = gf
 
-        self._parity_check_matrix = build_parity_check_matrix(
-            self._code_length, self._exss_length, gf
-        )
+        self._build_matrices()
 
-        self._generator_matrix = build_generator_matrix(self._parity_check_matrix)
+        self._backend = "table"
+        self._solvers = OrderedDict()
 
     @property 
     def code_length(self):
@@ -41,6 +52,22 @@ class Decoder(ABC):
     @property 
     def gf(self):
         return self._gf
+
+    @property
+    def spec(self):
+        return self._spec
+
+    @property
+    def backend(self):
+        return self._backend
+
+    @backend.setter
+    def backend(self, value):
+        if value not in self.backends:
+            raise ValueError(f"Unsupported backend: {value}")
+        if value == "bitslice" and self._gf.chr != 2:
+            raise ValueError("Bit-sliced backend needs binary code")
+        self._backend = value
     
     @code_length.setter
     def code_length(self, value):
@@ -57,6 +84,9 @@ class Decoder(ABC):
     @parity_check_matrix.setter
     def parity_check_matrix(self, value):
         self._parity_check_matrix = value
+        self._syndrome_table = build_syndrome_table(value, self._gf.chr)
+        # cached solvers were factored from columns of the old H
+        self._solvers = OrderedDict()
 
     @generator_matrix.setter
     def generator_matrix(self, value):
@@ -66,16 +96,129 @@ class Decoder(ABC):
     def gf(self, value):
         self._gf = value
 
-    
+
+    def _build_matrices(self):
+        '''
+        H, G and syndrome table of the code, shared read-only with coder
+        and other codecs
+        '''
+        self._spec = CodeSpec(self._code_length, self._base_length, self._gf)
+
+        self._parity_check_matrix = self._spec.parity_check_matrix
+        self._generator_matrix = self._spec.generator_matrix
+        self._syndrome_table = self._spec.syndrome_table
+
+    def locate_errors(self, syndromes: np.ndarray):
+        '''
+        Return (positions, magnitudes) of single errors for syndromes [.. x r],
+        position is -1 for zero or uncorrectable syndrome
+        '''
+        positions, magnitudes = self._syndrome_table
+        packed = pack_syndromes(syndromes, self.gf.chr)
+        return positions[packed], magnitudes[packed]
+
+    def erasure_columns(self, erased: np.ndarray) -> np.ndarray:
+        '''
+        Columns of H at erased positions of a word, erased is bool [n]
+        '''
+        return self.parity_check_matrix[:, erased]
+
+    def erasure_solver(self, erased: np.ndarray):
+        '''
+        factor_solver of erased columns, None when they are dependent.
+        Cached by erasure pattern across calls
+        '''
+        key = np.packbits(erased).tobytes()
+
+        if key in self._solvers:
+            self._solvers.move_to_end(key)
+            return self._solvers[key]
+
+        solver = factor_solver(self.erasure_columns(erased), self.gf.chr)
+
+        self._solvers[key] = solver
+        while len(self._solvers) > self.solver_cache_size:
+            self._solvers.popitem(last=False)
+
+        return solver
+
+    def fill_erasures(self, words: np.ndarray, erased: np.ndarray, syndromes: np.ndarray) -> np.ndarray:
+        '''
+        Fill erased symbols of int words [m x n] in place with solution of
+        H[:, erased] x = -s, erased symbols are 0 in words and in syndromes.
+        Rows with the same erasure pattern are solved together by one
+        factored solver. Returns bool mask of rows that were solved
+        '''
+        q = self.gf.chr
+        solved = np.zeros(words.shape[0], dtype=bool)
+
+        rows = np.flatnonzero(np.any(erased, axis=1))
+        if rows.size == 0:
+            return solved
+
+        # sort rows by packed erasure pattern, groups start where it changes
+        keys = pack_bits(erased[rows])
+        order = np.lexsort(keys.T[::-1])
+        rows, keys = rows[order], keys[order]
+        starts = np.flatnonzero(np.concatenate([[True], np.any(keys[1:] != keys[:-1], axis=1)]))
+
+        for members in np.split(rows, starts[1:]):
+            pattern = erased[members[0]]
+            solver = self.erasure_solver(pattern)
+            if solver is None:
+                continue
+
+            S, C = solver
+            b = (-syndromes[members]) % q
+
+            # consistent right-hand sides have unique solution S b
+            members = members[~np.any(gf_matmul(b, C.T, q) != 0, axis=1)]
+            b = (-syndromes[members]) % q
+
+            words[np.ix_(members, np.flatnonzero(pattern))] = gf_matmul(b, S.T, q)
+            solved[members] = True
+
+        return solved
+
+    def empty_result(self) -> DecodeResult:
+        '''
+        DecodeResult of an empty batch
+        '''
+        return DecodeResult(
+            np.empty((0, self.exss_length), dtype=int), np.empty(0, dtype=np.uint8),
+            np.empty(0, dtype=int), np.empty(0, dtype=int)
+        )
+
+    def find_erasures(self, words: np.ndarray):
+        return split_erasures(words, self.gf.chr)[1]
+
+    def decode_result(self,
+        syndromes: np.ndarray, erased: np.ndarray, solved: np.ndarray,
+        applied: np.ndarray, positions: np.ndarray, magnitudes: np.ndarray
+    ) -> DecodeResult:
+        '''
+        DecodeResult of a batch: erased [m x n] symbols, rows with solved
+        erasures and rows where correction (positions, magnitudes) was applied.
+        Correction applied after filling erasures is reported as corrected
+        '''
+        status = np.full(syndromes.shape[0], DecodeResult.DETECTED, dtype=np.uint8)
+
+        status[~np.any(syndromes != 0, axis=1)] = DecodeResult.CLEAN
+        status[solved] = DecodeResult.ERASURE_FILLED
+        status[applied] = DecodeResult.CORRECTED
+        status[np.any(erased, axis=1) & ~solved] = DecodeResult.FAILED
+
+        return DecodeResult(
+            syndromes, status,
+            np.where(applied, positions, -1), np.where(applied, magnitudes, 0)
+        )
+
     @abstractmethod
     def find_errors(self, words: np.ndarray): pass
 
     @abstractmethod
     def detect_and_correct(self, words: np.ndarray): pass
 
-    @abstractmethod
-    def find_erasures(self, words: np.ndarray): pass
-
     
 
     
\ No newline at end of file
@@ -1,15 +1,19 @@
 import numpy as np
 
+from linalg.gf_linalg import gf_matmul
+from linalg.bit_sliced import slice_bits, unslice_bits, sliced_correct
 from .Decoder import *
 
 class ExtendedDecoder(Decoder):
 
     def __init__(self,
-        code_length: int, base_length: int, gf: GaluaField
+        code_length: int, base_length: int, gf: GaluaField,
+        backend: str = "table"
     ):
         super().__init__(code_length, base_length, gf)
 
         self._extend_code_length = code_length + 1
+        self.backend = backend
 
     @property
     def extend_code_length(self):
@@ -23,98 +27,73 @@ class ExtendedDecoder(Decoder):
         data = words[:, :self.code_length]
         H = self.parity_check_matrix
         q = self.gf.chr
-        syndromes = (H @ data.T) % q
+        syndromes = gf_matmul(H, data.T, q)
         return syndromes.T
 
 
-    def detect_and_correct(self, words: np.ndarray):
+    def detect_and_correct(self, words: np.ndarray, return_result: bool = False):
+        '''
+        Corrected words, with return_result also their DecodeResult
+        (computed by table backend), parity symbol has position n
+        '''
         if words.size == 0:
-            return words
-
-        # Handle erasures when symbols with 'z' are provided
-        if words.dtype.type is np.str_ or words.dtype.kind in ('U', 'S'):
-            sym = words
-            n = self.code_length
-            H = self.parity_check_matrix
-            q = self.gf.chr
-            corrected = np.zeros(sym.shape, dtype=int)
-
-            for i in range(sym.shape[0]):
-                row = sym[i]
-                data_sym = row[:n]
-                parity_sym = row[n]
-
-                er_mask = (data_sym == 'z')
-                data_int = np.zeros(data_sym.shape, dtype=int)
-                data_int[~er_mask] = np.array([int(c) for c in data_sym[~er_mask]], dtype=int)
-
-                # compute syndrome on known part
-                s = (H @ data_int) % q
-                if np.any(er_mask):
-                    from linalg.code_matrix import solve_linear_mod
-                    A = H[:, er_mask]
-                    b = (-s) % q
-                    x, ok = solve_linear_mod(A, b, q)
-                    if ok:
-                        data_int[er_mask] = x % q
-                    # recompute syndrome after filling erasures
-                    s = (H @ data_int) % q
-
-                # handle parity symbol and possible single-error correction
-                parity_int = int(parity_sym) if parity_sym != 'z' else 0
-                total_parity = (np.sum(data_int) + parity_int) % q
-
-                if np.all(s == 0):
-                    # no data error; if parity inconsistent, fix parity
-                    if total_parity != 0:
-                        parity_int = (-np.sum(data_int)) % q
-                else:
-                    # non-zero syndrome: if parity inconsistent, try single data-symbol correction
-                    if total_parity != 0:
-                        from linalg.code_matrix import find_error_with_scalar
-                        j, a = find_error_with_scalar(s, H, q)
-                        if j is not None and a is not None:
-                            data_int[j] = (data_int[j] - a) % q
-                            # after correction, enforce parity consistency
-                            parity_int = (-np.sum(data_int)) % q
-                    # else: detected double-error; leave as-is
-
-                corrected[i, :n] = data_int % q
-                corrected[i, n] = parity_int % q
-            return corrected
-
-        corrected = words.copy()
+            return (words, self.empty_result()) if return_result else words
+
         n = self.code_length
-        H = self.parity_check_matrix
         q = self.gf.chr
 
-        for i in range(corrected.shape[0]):
-            y = corrected[i, :n]
-            parity_bit = corrected[i, n]
-
-            s = (H @ y) % q
-            total_parity = (np.sum(y) + parity_bit) % q  # should be 0 for even parity in GF(2)
-
-            if np.all(s == 0):
-                if total_parity != 0:
-                    corrected[i, n] = (-np.sum(y)) % q
-                continue
-
-            # non-zero syndrome
-            from linalg.code_matrix import find_error_with_scalar
-            j, a = find_error_with_scalar(s, H, q)
-            if j is not None and a is not None and total_parity != 0:
-                # single data-symbol error with magnitude a
-                corrected[i, j] = (corrected[i, j] - a) % q
-            else:
-                # double-error detected (uncorrectable in extended Hamming)
-                # leave as-is
-                pass
-
-        return corrected
-
-
-    def find_erasures(self, words: np.ndarray):
-        if words.dtype.type is np.str_ or words.dtype.kind in ('U', 'S'):
-            return words == 'z'
-        return np.zeros_like(words, dtype=bool)
\ No newline at end of file
+        # numeric words with erasure_symbol or symbol arrays with 'z'
+        values, erased = split_erasures(words, q)
+
+        if self.backend == "bitslice" and not return_result and not np.any(erased):
+            # overall parity row on top of [H | 0]: parity error has column
+            # e_0, data error needs odd overall parity, as below
+            extended = np.zeros((self.exss_length + 1, n + 1), dtype=int)
+            extended[0] = 1
+            extended[1:, :n] = self.parity_check_matrix
+
+            planes = sliced_correct(slice_bits(values), extended)
+            return unslice_bits(planes, words.shape[0]).astype(int)
+
+        # data erasures are solved from H, erased parity symbol is 0 and
+        # gets restored as inconsistent parity below
+        syndromes = self.find_errors(values)
+        solved = self.fill_erasures(values[:, :n], erased[:, :n], syndromes)
+
+        data_sum = np.sum(values[:, :n], axis=1)
+        total_parity = (data_sum + values[:, n]) % q  # should be 0 for even parity in GF(2)
+
+        # zero syndrome (solved erasures leave none) with inconsistent parity:
+        # error in parity symbol
+        parity_rows = (~np.any(syndromes != 0, axis=1) | solved) & (total_parity != 0)
+        values[parity_rows, n] = (-data_sum[parity_rows]) % q
+
+        # non-zero syndrome with inconsistent parity: single data-symbol error,
+        # consistent parity means double error (uncorrectable), left as-is.
+        # Erased parity symbol counts as 0 here too
+        positions, magnitudes = self.locate_errors(syndromes)
+        data_rows = (positions >= 0) & (total_parity != 0) & ~solved
+        rows = np.flatnonzero(data_rows)
+        cols = positions[rows]
+
+        values[rows, cols] = (values[rows, cols] - magnitudes[rows]) % q
+
+        # words with erasures get parity symbol of corrected data
+        rows = np.flatnonzero(data_rows & np.any(erased, axis=1))
+        values[rows, n] = (-np.sum(values[rows, :n], axis=1)) % q
+
+        if not return_result:
+            return values
+
+        # erased parity symbol is filled, not corrected, only when data has
+        # no error; otherwise word is corrected or detected, not failed
+        data_erased = np.any(erased[:, :n], axis=1)
+        filled = np.where(data_erased, solved, erased[:, n] & ~np.any(syndromes != 0, axis=1))
+        parity_rows &= ~erased[:, n]
+
+        positions = np.where(parity_rows, n, positions)
+        magnitudes = np.where(parity_rows, total_parity, magnitudes)
+
+        return values, self.decode_result(
+            syndromes, erased[:, :n], filled, data_rows | parity_rows, positions, magnitudes
+        )
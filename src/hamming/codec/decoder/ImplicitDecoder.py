@@ -0,0 +1,72 @@
+import numpy as np
+
+from .Decoder import *
+
+class ImplicitDecoder(Decoder):
+    '''
+    Full length Hamming decoder over implicit layout of linalg.code_matrix,
+    error position is derived from normalized syndrome arithmetically
+    '''
+
+    block_size = 1 << 12
+
+    def __init__(self,
+        code_length: int, base_length: int, gf: GaluaField
+    ):
+        if implicit_code_length(code_length - base_length, gf.chr) != code_length:
+            raise ValueError("Implicit code must have length (q^r - 1) / (q - 1)")
+
+        super().__init__(code_length, base_length, gf)
+
+    def _build_matrices(self):
+        # no spec or syndrome table, positions come from implicit_positions
+        self._spec = None
+
+    @property
+    def parity_check_matrix(self):
+        return implicit_columns(np.arange(self.code_length), self.exss_length, self.gf.chr)
+
+    @property
+    def generator_matrix(self):
+        return build_generator_matrix(self.parity_check_matrix)
+
+    def locate_errors(self, syndromes: np.ndarray):
+        syndromes = np.asarray(syndromes)
+        positions, magnitudes = implicit_positions(syndromes.reshape(-1, self.exss_length), self.gf.chr)
+        return positions.reshape(syndromes.shape[:-1]), magnitudes.reshape(syndromes.shape[:-1])
+
+
+    def find_errors(self, words: np.ndarray):
+        if words.size == 0:
+            return np.empty((0, self.exss_length), dtype=int)
+
+        return implicit_syndromes(words, self.exss_length, self.gf.chr, self.block_size)
+
+
+    def erasure_columns(self, erased: np.ndarray):
+        # only erased columns are generated
+        return implicit_columns(np.flatnonzero(erased), self.exss_length, self.gf.chr)
+
+
+    def detect_and_correct(self, words: np.ndarray, return_result: bool = False):
+        if words.size == 0:
+            return (words, self.empty_result()) if return_result else words
+
+        q = self.gf.chr
+
+        # numeric words with erasure_symbol or symbol arrays with 'z'
+        values, erased = split_erasures(words, q)
+
+        syndromes = self.find_errors(values)
+        solved = self.fill_erasures(values, erased, syndromes)
+
+        positions, magnitudes = self.locate_errors(syndromes)
+        applied = (positions >= 0) & ~solved
+        rows = np.flatnonzero(applied)
+        cols = positions[rows]
+
+        values[rows, cols] = (values[rows, cols] - magnitudes[rows]) % q
+
+        if return_result:
+            return values, self.decode_result(syndromes, erased, solved, applied, positions, magnitudes)
+        return values
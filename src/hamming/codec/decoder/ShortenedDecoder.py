@@ -1,5 +1,6 @@
 import numpy as np
 
+from linalg.gf_linalg import gf_matmul
 from .Decoder import *
 
 class ShortenedDecoder(Decoder):
@@ -23,88 +24,44 @@ class ShortenedDecoder(Decoder):
     
 
     def find_errors(self, words: np.ndarray):
-        # Embed shortened codewords by prefixing zeros for the shortened columns
+        # shortened columns are zero, only transmitted part of H contributes
         if words.size == 0:
             return np.empty((0, self.exss_length), dtype=int)
 
-        n_full = self.code_length
-        n_short_removed = self.short_code_length
-
-        embedded = np.zeros((words.shape[0], n_full), dtype=int)
-        embedded[:, n_short_removed:] = words
-
-        H = self.parity_check_matrix
+        H = self.parity_check_matrix[:, self.short_code_length:]
         q = self.gf.chr
-        syndromes = (H @ embedded.T) % q
+        syndromes = gf_matmul(H, words.T, q)
         return syndromes.T
 
 
-    def detect_and_correct(self, words: np.ndarray): 
+    def erasure_columns(self, erased: np.ndarray):
+        return self.parity_check_matrix[:, self.short_code_length:][:, erased]
+
+
+    def detect_and_correct(self, words: np.ndarray, return_result: bool = False):
         if words.size == 0:
-            return words
+            return (words, self.empty_result()) if return_result else words
 
-        n_full = self.code_length
         n_short_removed = self.short_code_length
         q = self.gf.chr
-        H = self.parity_check_matrix
-
-        # Handle erasures
-        if words.dtype.type is np.str_ or words.dtype.kind in ('U', 'S'):
-            sym = words
-            corrected_full = np.zeros((words.shape[0], n_full), dtype=int)
-            for i in range(sym.shape[0]):
-                row = sym[i]
-                
-                y = np.zeros(n_full, dtype=int)
-                seg = row
-                er_mask_short = (seg == 'z')
-                known_short = np.zeros(seg.shape, dtype=int)
-                known_short[~(er_mask_short)] = np.array([int(c) for c in seg[~er_mask_short]], dtype=int)
-                y[n_short_removed:] = known_short
-
-                er_full_mask = np.zeros(n_full, dtype=bool)
-                er_full_mask[n_short_removed:] = er_mask_short
-                s = (H @ y) % q
-                if np.any(er_full_mask):
-                    from linalg.code_matrix import solve_linear_mod
-                    A = H[:, er_full_mask]
-                    b = (-s) % q
-                    x, ok = solve_linear_mod(A, b, q)
-                    if ok:
-                        y[er_full_mask] = x % q
-                else:
-                    if np.any(s != 0):
-                        from linalg.code_matrix import find_error_with_scalar
-                        j, a = find_error_with_scalar(s, H, q)
-                        if j is not None and a is not None and j >= n_short_removed:
-                            y[j] = (y[j] - a) % q
-                corrected_full[i] = y
-
-            return corrected_full[:, n_short_removed:]
-
-        corrected_full = np.zeros((words.shape[0], n_full), dtype=int)
-        corrected_full[:, n_short_removed:] = words
-
-        for i in range(corrected_full.shape[0]):
-            y = corrected_full[i]
-            s = (H @ y) % q
-            if np.all(s == 0):
-                continue
-            from linalg.code_matrix import find_error_with_scalar
-            j, a = find_error_with_scalar(s, H, q)
-            if j is not None and a is not None:
-                # only transmitted positions can be flipped
-                if j >= n_short_removed:
-                    corrected_full[i, j] = (corrected_full[i, j] - a) % q
-                else:
-                    # error localized to a punctured position; cannot correct
-                    pass
-
-        # return only shortened part
-        return corrected_full[:, n_short_removed:]
-
-
-    def find_erasures(self, words: np.ndarray):
-        if words.dtype.type is np.str_ or words.dtype.kind in ('U', 'S'):
-            return words == 'z'
-        return np.zeros_like(words, dtype=bool)
\ No newline at end of file
+
+        # numeric words with erasure_symbol or symbol arrays with 'z'
+        values, erased = split_erasures(words, q)
+
+        syndromes = self.find_errors(values)
+        solved = self.fill_erasures(values, erased, syndromes)
+
+        # only transmitted positions of words without erasures are corrected,
+        # errors localized to a punctured position are left as-is
+        positions, magnitudes = self.locate_errors(syndromes)
+        positions = positions - n_short_removed
+
+        applied = (positions >= 0) & ~np.any(erased, axis=1)
+        rows = np.flatnonzero(applied)
+        cols = positions[rows]
+
+        values[rows, cols] = (values[rows, cols] - magnitudes[rows]) % q
+
+        if return_result:
+            return values, self.decode_result(syndromes, erased, solved, applied, positions, magnitudes)
+        return values
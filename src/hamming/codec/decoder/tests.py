@@ -2,7 +2,12 @@ import numpy as np
 
 from galua.GaluaField import GaluaField
 from hamming.codec.HammingCodec import HammingCodec
+from hamming.codec.CodeSpec import CodeSpec
+from hamming.codec.DecodeResult import DecodeResult
+from hamming.codec.decoder.ClassicDecoder import ClassicDecoder
+from hamming.codec.decoder.ExtendedDecoder import ExtendedDecoder
 from hamming.ThreadGenerator import ThreadGenerator
+from linalg.code_matrix import erasure_symbol
 
 def run_all_tests():
     test_classic_decoder_corrects_single_error()
@@ -11,6 +16,17 @@ def run_all_tests():
     test_codec_round_trip_classic()
     test_classic_decoder_q3_corrects_single_symbol_error()
     test_classic_decoder_q5_corrects_single_symbol_error()
+    test_batch_decode_all_single_errors()
+    test_implicit_codec_corrects_single_error()
+    test_codecs_share_code_spec()
+    test_code_spec_store()
+    test_packed_codec_matches_codec()
+    test_bitslice_backend_matches_table()
+    test_lookup_codec_matches_codec()
+    test_numeric_erasures_match_symbols()
+    test_extended_parity_erasures_match_symbols()
+    test_erasure_solvers_grouped_by_pattern()
+    test_decode_result_reports_status()
     print("All Decoder tests passed")
 
 
@@ -109,19 +125,8 @@ def test_codec_round_trip_classic():
 
 
 def _gf_q_r(q: int, r: int) -> GaluaField:
-    # Minimal polynomials for small q,r used in tests
-    if q == 3 and r == 2:
-        # x^2 + 1 over F3 (irreducible)
-        pol = [1, 0, 1]
-    elif q == 5 and r == 2:
-        # x^2 + 2 over F5 (irreducible)
-        pol = [2, 0, 1]
-    else:
-        # fallback monic
-        pol = [0]*(r+1)
-        pol[0] = 1
-        pol[-1] = 1
-    return GaluaField(q, r, pol)
+    # GaluaField accepts only primitive polynomials
+    return GaluaField.primitive(q, r)
 
 
 def test_classic_decoder_q3_corrects_single_symbol_error():
@@ -230,3 +235,389 @@ def test_shortened_decoder_q3_corrects_single_symbol_error():
     info_dec, corrected = codec.decode(code_err)
     assert np.array_equal(info_dec % q, words % q)
     assert np.array_equal(corrected % q, code % q)
+
+
+def test_batch_decode_all_single_errors():
+    # every position and magnitude of single error in one batch
+    cases = (
+        ("classic", 3, 13, 10, 0),
+        ("extended", 2, 15, 11, 0),
+        ("shortened", 3, 13, 10, 3),
+    )
+    rng = np.random.default_rng(2024)
+
+    for code_type, q, n, k, removed in cases:
+        gf = GaluaField.primitive(q, n - k)
+        extra = {"short_code_length": removed, "short_base_length": 0} if removed else {}
+        codec = HammingCodec(code_type, n, k, gf, **extra)
+
+        words = rng.integers(0, q, size=(1, k - removed))
+        code = codec.encode(words)
+
+        errors = np.array([(j, a) for j in range(code.shape[1]) for a in range(1, q)])
+        count = errors.shape[0]
+        code_err = np.repeat(code, count, axis=0)
+        code_err[np.arange(count), errors[:, 0]] += errors[:, 1]
+        code_err %= q
+
+        info_dec, corrected = codec.decode(code_err)
+        assert np.array_equal(corrected, np.repeat(code, count, axis=0)), code_type
+        assert np.array_equal(info_dec, np.repeat(words, count, axis=0)), code_type
+
+
+def test_implicit_codec_corrects_single_error():
+    # (2^16 - 1, 2^16 - 17) binary and (13, 10) ternary codes, H is never built
+    rng = np.random.default_rng(16)
+
+    for q, r in ((2, 16), (3, 3)):
+        n = (q ** r - 1) // (q - 1)
+        k = n - r
+        codec = HammingCodec("implicit", n, k, GaluaField.primitive(q, r))
+
+        words = rng.integers(0, q, size=(6, k))
+        code = codec.encode(words)
+        assert code.shape == (6, n)
+
+        code_err = code.copy()
+        # last rows hit parity positions
+        idx = np.concatenate([rng.integers(0, k, size=4), [k, n - 1]])
+        code_err[np.arange(6), idx] = (code_err[np.arange(6), idx] + rng.integers(1, q, size=6)) % q
+
+        info_dec, corrected = codec.decode(code_err)
+        assert np.array_equal(corrected, code)
+        assert np.array_equal(info_dec, words)
+
+        # erasures are filled from generated columns only
+        erased = code.astype(str)
+        erased[:, [0, n - 1]] = 'z'
+        assert np.array_equal(codec.decoder.detect_and_correct(erased), code)
+
+        # base constructors ran without building matrices
+        assert codec.spec is None and codec.decoder.backend == "table"
+
+    # only full length codes have implicit layout
+    try:
+        HammingCodec("implicit", 6, 3, GaluaField.primitive(2, 3))
+        assert False
+    except ValueError:
+        pass
+
+
+def test_codecs_share_code_spec():
+    CodeSpec.cache_clear()
+    gf = _gf_2_r(3)
+
+    classic = HammingCodec("classic", 7, 4, gf)
+    extended = HammingCodec("extended", 7, 4, gf)
+    shortened = HammingCodec("shortened", 7, 4, gf, short_code_length=1, short_base_length=0)
+
+    # one build for coder, decoder and all codecs of the same (n, k, field)
+    spec = classic.spec
+    assert classic.decoder.spec is spec
+    assert extended.spec is spec and shortened.decoder.spec is spec
+    assert HammingCodec("classic", 7, 4, _gf_q_r(3, 2)).spec is not spec
+
+    assert classic.coder.parity_check_matrix is spec.parity_check_matrix
+    assert not spec.parity_check_matrix.flags.writeable
+    assert not spec.generator_matrix.flags.writeable
+    assert not spec.syndrome_table[0].flags.writeable
+    assert HammingCodec("implicit", 7, 4, gf).spec is None
+
+
+def test_code_spec_store():
+    import tempfile
+    from galua import store
+
+    previous = store.cache_dir()
+
+    with tempfile.TemporaryDirectory() as directory:
+        store.set_cache_dir(directory)
+        try:
+            CodeSpec.cache_clear()
+            gf = GaluaField.primitive(2, 9)
+            built = CodeSpec(511, 502, gf)
+
+            CodeSpec.cache_clear()
+            loaded = CodeSpec(511, 502, gf)
+            assert loaded is not built
+            assert isinstance(loaded.generator_matrix, np.memmap)
+            assert np.array_equal(loaded.parity_check_matrix, built.parity_check_matrix)
+            assert np.array_equal(loaded.generator_matrix, built.generator_matrix)
+            for stored, table in zip(loaded.syndrome_table, built.syndrome_table):
+                assert np.array_equal(stored, table)
+
+            codec = HammingCodec("classic", 511, 502, gf)
+            words = np.random.default_rng(8).integers(0, 2, size=(4, 502))
+            code = codec.encode(words)
+            code[:, 100] ^= 1
+            assert np.array_equal(codec.decode(code)[0], words)
+        finally:
+            store.set_cache_dir(previous)
+            CodeSpec.cache_clear()
+
+
+def test_packed_codec_matches_codec():
+    from linalg.bit_packed import pack_bits, unpack_bits
+
+    rng = np.random.default_rng(19)
+    cases = (
+        ("classic", 15, 11, {}),
+        ("extended", 15, 11, {}),
+        ("shortened", 15, 11, {"short_code_length": 3, "short_base_length": 0}),
+        ("classic", 127, 120, {}),
+    )
+
+    for code_type, n, k, extra in cases:
+        codec = HammingCodec(code_type, n, k, GaluaField.primitive(2, n - k), **extra)
+        packed = codec.packed()
+
+        words = rng.integers(0, 2, size=(500, k - extra.get("short_code_length", 0)))
+        code = codec.encode(words)
+        length = code.shape[1]
+        assert np.array_equal(unpack_bits(packed.encode(pack_bits(words)), length), code)
+
+        # up to a few random errors, packed decoder does exactly what codec does
+        code_err = code ^ (rng.random(code.shape) < 0.03)
+        info_dec, corrected = codec.decode(code_err)
+        packed_info, packed_corrected = packed.decode(pack_bits(code_err))
+
+        assert np.array_equal(unpack_bits(packed_corrected, length), corrected), code_type
+        assert np.array_equal(unpack_bits(packed_info, words.shape[1]), info_dec), code_type
+
+    try:
+        HammingCodec("classic", 4, 2, _gf_q_r(3, 2)).packed()
+        assert False
+    except ValueError:
+        pass
+
+
+def test_bitslice_backend_matches_table():
+    rng = np.random.default_rng(20)
+
+    for n, k in ((7, 4), (15, 11), (31, 26)):
+        gf = GaluaField.primitive(2, n - k)
+
+        for decoder_type, length in ((ClassicDecoder, n), (ExtendedDecoder, n + 1)):
+            table = decoder_type(n, k, gf)
+            sliced = decoder_type(n, k, gf, backend="bitslice")
+
+            # no, single and double errors, batch not multiple of 64
+            words = rng.integers(0, 2, size=(300, length))
+            words = words ^ (rng.random(words.shape) < 0.05)
+            assert np.array_equal(sliced.detect_and_correct(words), table.detect_and_correct(words))
+
+    try:
+        ClassicDecoder(4, 2, _gf_q_r(3, 2), backend="bitslice")
+        assert False
+    except ValueError:
+        pass
+
+
+def test_lookup_codec_matches_codec():
+    rng = np.random.default_rng(22)
+
+    for args in (
+        ("classic", 7, 4, GaluaField.primitive(2, 3)),
+        ("extended", 7, 4, GaluaField.primitive(2, 3)),
+        ("shortened", 7, 4, GaluaField.primitive(2, 3), 1, 0),
+        ("classic", 4, 2, GaluaField.primitive(3, 2)),
+    ):
+        codec = HammingCodec(*args)
+        lookup = codec.lookup()
+        q = args[3].chr
+
+        info = rng.integers(0, q, size=(200, lookup.info_length))
+        code = codec.encode(info)
+        assert np.array_equal(lookup.encode(info), code)
+
+        # every received word decodes like the codec
+        received = rng.integers(0, q, size=(500, lookup.code_length))
+        received[:200] = code
+        received[100:200, 0] = (received[100:200, 0] + 1) % q
+
+        expected, corrected = codec.decode(received)
+        decoded, status = lookup.decode(received)
+        assert np.array_equal(decoded, expected)
+
+        assert np.all(status[:100] == DecodeResult.CLEAN)
+        assert np.all(status[100:200] == DecodeResult.CORRECTED)
+        assert np.all((status == DecodeResult.DETECTED) == np.any(lookup.encode(expected) != corrected, axis=1))
+
+    # double errors of extended code are detected, not corrected
+    lookup = HammingCodec("extended", 7, 4, GaluaField.primitive(2, 3)).lookup()
+    double = lookup.encode(np.zeros((1, 4), dtype=int))
+    double[0, :2] ^= 1
+    assert lookup.decode(double)[1][0] == DecodeResult.DETECTED
+
+    try:
+        HammingCodec("classic", 31, 26, GaluaField.primitive(2, 5)).lookup()
+        assert False
+    except ValueError:
+        pass
+
+
+def test_numeric_erasures_match_symbols():
+    rng = np.random.default_rng(23)
+
+    for args in (
+        ("classic", 7, 4, _gf_2_r(3)),
+        ("extended", 7, 4, _gf_2_r(3)),
+        ("shortened", 7, 4, _gf_2_r(3), 1, 0),
+        ("classic", 13, 10, GaluaField.primitive(3, 3)),
+        ("implicit", 15, 11, GaluaField.primitive(2, 4)),
+    ):
+        codec = HammingCodec(*args)
+        q = args[3].chr
+
+        code = codec.encode(rng.integers(0, q, size=(40, args[2] - (args[4] if len(args) > 4 else 0))))
+        gen = ThreadGenerator(ThreadGenerator.make_base(q, with_erasure=True), *code.shape[::-1])
+
+        # up to r erasures are filled, rows with one error and no erasures corrected
+        received = gen.generate_data_thread(code, [0.0, 0.0], fixed_erasures_per_word=2)
+        received[:10] = gen.generate_data_thread(code[:10], [0.0, 0.0], one_error_per_word=True)
+        assert received.dtype == np.uint8
+
+        info, corrected = codec.decode(received)
+        assert np.array_equal(corrected, code)
+
+        symbol_info, symbol_corrected = codec.decode(gen.to_symbols(received))
+        assert np.array_equal(symbol_info, info) and np.array_equal(symbol_corrected, corrected)
+
+        assert np.array_equal(codec.decoder.find_erasures(received), received == erasure_symbol)
+
+
+def test_extended_parity_erasures_match_symbols():
+    rng = np.random.default_rng(230)
+
+    for gf in (_gf_2_r(3), GaluaField.primitive(3, 2)):
+        q = gf.chr
+        n = (q ** gf.orp - 1) // (q - 1)
+        codec = HammingCodec("extended", n, n - gf.orp, gf)
+        code = codec.encode(rng.integers(0, q, size=(60, n - gf.orp)))
+        # decoder takes words with zero total parity
+        code[:, n] = (-np.sum(code[:, :n], axis=1)) % q
+
+        # erased parity on every word, a data error on second half
+        received = code.astype(np.uint8)
+        received[:, n] = erasure_symbol
+        received[30:, 0] = (received[30:, 0] + rng.integers(1, q, size=30)) % q
+        received[::5, 1] = erasure_symbol
+
+        info, corrected, result = codec.decode(received, return_result=True)
+        symbols = np.where(received == erasure_symbol, 'z', received.astype(str))
+        symbol_info, symbol_corrected, symbol_result = codec.decode(symbols, return_result=True)
+
+        assert np.array_equal(symbol_corrected, corrected)
+        assert np.array_equal(symbol_result.status, result.status)
+
+        # with parity erased, data error is corrected only when data parity
+        # is inconsistent, otherwise detected and left as-is
+        odd = np.sum(received[30:, :n].astype(int), axis=1) % q != 0
+        single = np.arange(30, 60)[(np.arange(30, 60) % 5 != 0)]
+        assert np.array_equal(corrected[:30], code[:30])
+        for row in single:
+            if odd[row - 30]:
+                assert np.array_equal(corrected[row], code[row]) and result.status[row] == DecodeResult.CORRECTED
+            else:
+                assert np.array_equal(corrected[row, :n], received[row, :n]) and result.status[row] == DecodeResult.DETECTED
+
+
+def test_erasure_solvers_grouped_by_pattern():
+    rng = np.random.default_rng(24)
+    gf = GaluaField.primitive(3, 3)
+    codec = HammingCodec("classic", 13, 10, gf)
+
+    code = codec.encode(rng.integers(0, 3, size=(60, 10)))
+    received = code.astype(np.uint8)
+
+    # two shared patterns, r + 1 erasures and dependent columns are not solved
+    received[:20, [0, 5]] = erasure_symbol
+    received[20:40, [1, 2, 12]] = erasure_symbol
+    received[40:50, :4] = erasure_symbol
+
+    decoder = codec.decoder
+    corrected = decoder.detect_and_correct(received)
+    assert np.array_equal(corrected[:40], code[:40]) and np.array_equal(corrected[50:], code[50:])
+
+    # one factored solver per pattern, reused by later calls
+    assert len(decoder._solvers) == 3
+    decoder.detect_and_correct(received[:20])
+    assert len(decoder._solvers) == 3
+    assert decoder.erasure_solver(received[40] == erasure_symbol) is None
+
+    # new H drops solvers of the old one for the same pattern
+    decoder = ClassicDecoder(4, 2, GaluaField.primitive(3, 2))
+    decoder.detect_and_correct(np.array([[erasure_symbol, erasure_symbol, 0, 0]], dtype=np.uint8))
+    decoder.parity_check_matrix = np.array([[1, 2, 1, 0], [1, 1, 0, 1]])
+    corrected = decoder.detect_and_correct(np.array([[erasure_symbol, erasure_symbol, 1, 0]], dtype=np.uint8))
+    assert np.array_equal(corrected, [[1, 2, 1, 0]])
+
+
+def test_decode_result_reports_status():
+    rng = np.random.default_rng(25)
+
+    # ternary classic: clean, corrected, filled and failed words
+    codec = HammingCodec("classic", 13, 10, GaluaField.primitive(3, 3))
+    code = codec.encode(rng.integers(0, 3, size=(8, 10)))
+
+    received = code.astype(np.uint8)
+    received[[2, 3], [4, 11]] = (received[[2, 3], [4, 11]] + [1, 2]) % 3
+    received[4:6, [0, 7]] = erasure_symbol
+    received[6:8, :5] = erasure_symbol
+
+    info, corrected, result = codec.decode(received, return_result=True)
+    assert np.array_equal(corrected[:6], code[:6])
+
+    assert list(result.status) == [0, 0, 1, 1, 2, 2, 4, 4]
+    assert list(result.positions[:4]) == [-1, -1, 4, 11]
+    assert list(result.magnitudes[:4]) == [0, 0, 1, 2]
+    assert np.array_equal(result.syndromes, codec.decoder.find_errors(np.where(received == erasure_symbol, 0, received)))
+    assert result.counts() == {"clean": 2, "corrected": 2, "erasure_filled": 2, "detected": 0, "failed": 2}
+
+    # extended: parity symbol error, erased parity and double error
+    codec = HammingCodec("extended", 7, 4, _gf_2_r(3))
+    code = codec.encode(rng.integers(0, 2, size=(4, 4)))
+
+    received = code.astype(np.uint8)
+    received[0, 7] ^= 1
+    received[1, 7] = erasure_symbol
+    received[2, [0, 1]] ^= 1
+
+    info, corrected, result = codec.decode(received, return_result=True)
+    assert list(result.status) == [1, 2, 3, 0]
+    assert list(result.positions) == [7, -1, -1, -1]
+    assert list(result.rows("detected")) == [2]
+
+    # erased parity with data error: corrected only when data parity is odd
+    code = codec.encode(np.array([[0, 0, 0, 0], [0, 1, 1, 0]]))
+    received = code.astype(np.uint8)
+    received[:, 7] = erasure_symbol
+    received[[0, 1], [0, 5]] ^= 1
+
+    info, corrected, result = codec.decode(received, return_result=True)
+    assert np.array_equal(corrected[0], code[0])
+    assert np.array_equal(corrected[1, :7], received[1, :7]) and corrected[1, 7] == 0
+    assert list(result.status) == [1, 3] and list(result.positions) == [0, -1]
+
+    # empty batch gives empty result
+    for codec in (codec, HammingCodec("classic", 13, 10, GaluaField.primitive(3, 3))):
+        words = np.empty((0, codec.decoder.code_length), dtype=int)
+        result = codec.decoder.detect_and_correct(words, return_result=True)[1]
+        assert result.syndromes.shape == (0, codec.decoder.exss_length)
+        assert result.status.size == result.positions.size == result.magnitudes.size == 0
+        assert result.counts()["clean"] == 0
+
+    # shortened positions are in transmitted coordinates, same for bitslice
+    codec = HammingCodec("shortened", 7, 4, _gf_2_r(3), 1, 0)
+    code = codec.encode(rng.integers(0, 2, size=(6, 3)))
+    received = code.copy()
+    received[np.arange(6), np.arange(6)] ^= 1
+
+    info, corrected, result = codec.decode(received, return_result=True)
+    assert np.array_equal(corrected, code) and list(result.positions) == list(range(6))
+
+    decoder = ClassicDecoder(7, 4, _gf_2_r(3), backend="bitslice")
+    table = ClassicDecoder(7, 4, _gf_2_r(3))
+    words = rng.integers(0, 2, size=(20, 7))
+    sliced_result = decoder.detect_and_correct(words, return_result=True)[1]
+    assert np.array_equal(sliced_result.status, table.detect_and_correct(words, return_result=True)[1].status)
@@ -11,7 +11,7 @@ def run_scenario_classic():
     n = 31
     k = 26
     r = n - k
-    gf = GaluaField(q, r, [1, 0, 1, 0, 0, 1])
+    gf = GaluaField.primitive(q, r)
     codec = HammingCodec("classic", n, k, gf)
 
     print("=== Classic q-ary Hamming scenario (q=5) ===")
@@ -27,7 +27,7 @@ def run_scenario_classic():
     coded = codec.encode(words)
 
     noisy = gen.generate_data_thread(
-        coded.astype(str),  # map to symbol strings for channel
+        coded,              # numeric words, erasures become erasure_symbol
         [0.0, 0.0],         # first is flip probability, second is erasure probability if you need erasures only use [0.0, 0.0]
         one_error_per_word=False, # add only one error per word
         fixed_erasures_per_word=2 # number of erasures per word
@@ -36,10 +36,12 @@ def run_scenario_classic():
 
     decoded_info, corrected = codec.decode(received)
 
+    received_symbols = gen.to_symbols(received)
+
     print("Scenario (info | received_with_errors_incl_z | decoded):")
     for i in range(words.shape[0]):
         s_info = ''.join(map(str, words[i].tolist()))
-        s_recv = ''.join(received[i].tolist())
+        s_recv = ''.join(received_symbols[i].tolist())
         s_dec = ''.join(map(str, decoded_info[i].tolist()))
         print(f"{s_info} | {s_recv} | {s_dec}")
 
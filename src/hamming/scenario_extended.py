@@ -43,39 +43,32 @@ def run_scenario_extended():
     coded = codec.encode(words)  # shape [m, n+1]
 
     noisy = gen.generate_data_thread(
-        coded.astype(str), 
+        coded, 
         [0.0, 0.0], # first is flip probability, second is erasure probability if you need erasures only use [0.0, 0.0]
         one_error_per_word=False, # add only one error per word
         fixed_erasures_per_word=3 # number of erasures per word
     )
     received = noisy
 
-    decoded_info, corrected = codec.decode(received)
+    decoded_info, corrected, result = codec.decode(received, return_result=True)
+
+    received_symbols = gen.to_symbols(received)
 
     print("Scenario (info | received_with_errors | decoded):")
     for i in range(words.shape[0]):
         s_info = ''.join(map(str, words[i].tolist()))
-        s_recv = ''.join(received[i].tolist())
+        s_recv = ''.join(received_symbols[i].tolist())
         s_dec = ''.join(map(str, decoded_info[i].tolist()))
         print(f"{s_info} | {s_recv} | {s_dec}")
 
-    H = codec.decoder.parity_check_matrix
-    qch = codec.decoder.gf.chr
-    to_int = {str(i): i for i in range(qch)}
-    numeric_received = np.zeros_like(coded, dtype=int)
-    for i in range(received.shape[0]):
-        for j in range(received.shape[1]):
-            c = received[i, j]
-            numeric_received[i, j] = 0 if c == 'z' else to_int[str(c)]
-    S_before = (H @ numeric_received[:, :n].T) % qch
-    S_after = (H @ corrected[:, :n].T) % qch
-    rows_detected = np.where(np.any(S_before.T != 0, axis=1))[0]
-    rows_no_change = rows_detected[np.where(~np.any((corrected != numeric_received)[rows_detected], axis=1))[0]]
-    rows_still = np.where(np.any(S_after.T != 0, axis=1))[0]
-    if rows_no_change.size > 0:
-        print("Detected but not corrected (no change):", rows_no_change.tolist())
-    if rows_still.size > 0:
-        print("After correction syndrome still != 0:", rows_still.tolist())
+    # per word outcome comes with decoding, no second syndrome pass
+    rows_detected = result.rows("detected")
+    rows_failed = result.rows("failed")
+    if rows_detected.size > 0:
+        print("Detected but not corrected (no change):", rows_detected.tolist())
+    if rows_failed.size > 0:
+        print("Erasures not filled:", rows_failed.tolist())
+    print("Status counts:", result.counts())
 
 if __name__ == "__main__":
     run_scenario_extended()
@@ -1,6 +1,7 @@
 from hamming.codec.HammingCodec import HammingCodec
 from galua.GaluaField import GaluaField
 from hamming.ThreadGenerator import ThreadGenerator
+from linalg.code_matrix import split_erasures
 import numpy as np
 
 def run_scenario_shortened():
@@ -52,7 +53,7 @@ def run_scenario_shortened():
     coded = codec.encode(words)
 
     noisy = gen.generate_data_thread(
-        coded.astype(str),
+        coded,
         [0.5, 0.5], # first is flip probability, second is erasure probability if you need erasures only use [0.0, 0.0]
         one_error_per_word=True, # add only one error per word  
         fixed_erasures_per_word=0 # number of erasures per word
@@ -61,21 +62,19 @@ def run_scenario_shortened():
 
     info_dec, corrected = codec.decode(received)
 
+    received_symbols = gen.to_symbols(received)
+
     print("Scenario (info' | received' | decoded'):")
     for i in range(words.shape[0]):
         s_info = ''.join(map(str, words[i].tolist()))
-        s_recv = ''.join(received[i].tolist())
+        s_recv = ''.join(received_symbols[i].tolist())
         s_dec = ''.join(map(str, info_dec[i].tolist()))
         print(f"{s_info} | {s_recv} | {s_dec}")
 
     H = codec.decoder.parity_check_matrix
     qch = codec.decoder.gf.chr
-    to_int = {str(i): i for i in range(qch)}
-    rec_short_num = np.zeros_like(coded, dtype=int)
-    for i in range(received.shape[0]):
-        for j in range(received.shape[1]):
-            c = received[i, j]
-            rec_short_num[i, j] = 0 if c == 'z' else to_int[str(c)]
+    # erased symbols count as 0
+    rec_short_num, _ = split_erasures(received, qch)
     rec_full = np.zeros((received.shape[0], n_full), dtype=int)
     rec_full[:, short_remove:] = rec_short_num % qch
     corr_full = np.zeros((corrected.shape[0], n_full), dtype=int)
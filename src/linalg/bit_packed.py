@@ -0,0 +1,123 @@
+import numpy as np
+
+
+'''
+Binary vectors packed into uint64 bitsets: bit j of a vector is bit
+j % 64 of word j // 64, unused high bits of the last word are zero.
+Sums over GF(2) are xor, inner products are parity of popcount of and.
+'''
+
+def packed_width(length: int) -> int:
+    '''
+    Number of uint64 words holding length bits
+    '''
+    return (length + 63) // 64
+
+
+def pack_bits(bits: np.ndarray) -> np.ndarray:
+
+    '''
+    Return 0/1 array [.. x n] packed into uint64 [.. x ceil(n / 64)]
+    '''
+
+    bits = np.asarray(bits)
+    n = bits.shape[-1]
+    width = packed_width(n)
+
+    # low bit of each entry as byte, contiguous along packed axis
+    low = np.ascontiguousarray(bits.astype(np.uint8) & np.uint8(1))
+
+    packed = np.zeros(bits.shape[:-1] + (8 * width,), dtype=np.uint8)
+    packed[..., :(n + 7) // 8] = np.packbits(low, axis=-1, bitorder='little')
+    return packed.view('<u8').astype(np.uint64, copy=False)
+
+
+def unpack_bits(packed: np.ndarray, length: int) -> np.ndarray:
+
+    '''
+    Return uint8 0/1 array [.. x length] of packed vectors
+    '''
+
+    packed = np.ascontiguousarray(packed, dtype='<u8')
+    bits = np.unpackbits(packed.view(np.uint8), axis=-1, bitorder='little')
+    return bits[..., :length]
+
+
+def build_encoding_tables(generator_matrix: np.ndarray) -> np.ndarray:
+
+    '''
+    Four-Russians tables of binary G [k x n]: rows are split into groups of
+    8, tables[g, b] is packed xor of rows 8g + i of G for set bits i of b,
+    shape [ceil(k / 8) x 256 x ceil(n / 64)]
+    '''
+
+    G = np.asarray(generator_matrix)
+    k, n = G.shape
+    groups = (k + 7) // 8
+
+    rows = np.zeros((groups * 8, packed_width(n)), dtype=np.uint64)
+    rows[:k] = pack_bits(G)
+    rows = rows.reshape(groups, 8, -1)
+
+    tables = np.zeros((groups, 256, rows.shape[2]), dtype=np.uint64)
+    for i in range(8):
+        # combinations with bit i set are the ones without it xor row i
+        tables[:, 1 << i:2 << i] = tables[:, :1 << i] ^ rows[:, i, np.newaxis, :]
+
+    return tables
+
+
+def table_encode(info_bytes: np.ndarray, tables: np.ndarray) -> np.ndarray:
+
+    '''
+    Return packed codewords [m x ceil(n / 64)] of info words given as bytes
+    [m x >= ceil(k / 8)] (little bit order, as in packed words), one table
+    lookup per info byte
+    '''
+
+    result = np.zeros((info_bytes.shape[0], tables.shape[2]), dtype=np.uint64)
+
+    for g in range(tables.shape[0]):
+        result ^= tables[g][info_bytes[:, g]]
+
+    return result
+
+
+def binary_encode(words: np.ndarray, tables: np.ndarray, code_length: int) -> np.ndarray:
+
+    '''
+    Return 0/1 codewords [.. x n] of info words [.. x k] taken mod 2 via
+    table_encode of tables built by build_encoding_tables
+    '''
+
+    words = np.asarray(words)
+    low = words.astype(np.uint8).reshape(-1, words.shape[-1]) & np.uint8(1)
+    info_bytes = np.packbits(low, axis=-1, bitorder='little')
+
+    packed = table_encode(info_bytes, tables)
+    return unpack_bits(packed, code_length).reshape(words.shape[:-1] + (code_length,))
+
+
+def packed_syndromes(words: np.ndarray, check_rows: np.ndarray) -> np.ndarray:
+
+    '''
+    Return syndromes of packed words [m x width] by packed H rows [r x width]
+    as integers with bit i equal to parity of popcount(word & H[i]), r <= 63
+    '''
+
+    result = np.zeros(words.shape[0], dtype=np.int64)
+
+    for i, row in enumerate(check_rows):
+        folded = np.bitwise_xor.reduce(words & row, axis=1)
+        result |= (np.bitwise_count(folded) & 1).astype(np.int64) << i
+
+    return result
+
+
+def flip_bits(words: np.ndarray, rows: np.ndarray, positions: np.ndarray):
+
+    '''
+    Flip bit positions[i] of words[rows[i]] in place, rows are distinct
+    '''
+
+    words[rows, positions // 64] ^= np.uint64(1) << (positions % 64).astype(np.uint64)
@@ -0,0 +1,71 @@
+import numpy as np
+
+from linalg.bit_packed import pack_bits, unpack_bits
+
+
+'''
+Bit-sliced binary words: a batch of m words [m x n] is transposed into n
+bit planes [n x ceil(m / 64)] uint64, bit b of plane j is bit j of word b.
+Every xor / and on planes serves 64 words at once.
+'''
+
+def slice_bits(words: np.ndarray) -> np.ndarray:
+    '''
+    Return 0/1 words [m x n] as bit planes [n x ceil(m / 64)]
+    '''
+    return pack_bits(np.asarray(words).T)
+
+
+def unslice_bits(planes: np.ndarray, count: int) -> np.ndarray:
+    '''
+    Return uint8 0/1 words [count x n] of bit planes
+    '''
+    return unpack_bits(planes, count).T
+
+
+def sliced_syndromes(planes: np.ndarray, parity_check_matrix: np.ndarray) -> np.ndarray:
+
+    '''
+    Return syndrome planes [r x width], plane i is xor of word planes
+    selected by row i of binary H
+    '''
+
+    H = np.asarray(parity_check_matrix) % 2
+    syndromes = np.zeros((H.shape[0], planes.shape[1]), dtype=np.uint64)
+
+    for i, row in enumerate(H):
+        selected = np.flatnonzero(row)
+        if selected.size:
+            syndromes[i] = np.bitwise_xor.reduce(planes[selected], axis=0)
+
+    return syndromes
+
+
+def sliced_correct(planes: np.ndarray, parity_check_matrix: np.ndarray) -> np.ndarray:
+
+    '''
+    Correct single errors in bit planes [n x width] in place: bit j of word
+    flips where its syndrome equals column j of binary H, first matching
+    column wins like in build_syndrome_table. Returns planes
+    '''
+
+    H = np.asarray(parity_check_matrix) % 2
+    syndromes = sliced_syndromes(planes, H)
+    inverted = ~syndromes
+
+    found = np.zeros(planes.shape[1], dtype=np.uint64)
+
+    for j in range(H.shape[1]):
+        # zero column has no syndrome, as in build_syndrome_table
+        if not H[:, j].any():
+            continue
+
+        # words whose syndrome bits all agree with column j
+        match = ~found
+        for i in range(H.shape[0]):
+            match &= syndromes[i] if H[i, j] else inverted[i]
+
+        planes[j] ^= match
+        found |= match
+
+    return planes
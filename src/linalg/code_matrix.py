@@ -1,8 +1,10 @@
 import numpy as np
 
-from galua.GaluaField import GaluaField
+from galua.GaluaField import GaluaField, binary_powers
 from galua.GaluaElement import GaluaElement
 
+from linalg.gf_linalg import solve, gf_matmul
+
 
 '''
 File that has functions to build matricies by code params for another purposes 
@@ -23,20 +25,9 @@ def build_parity_check_matrix(
     n = code_length
     q = gf.chr
 
-    # Work on a copy to avoid mutating gf.values globally across coder/decoder builds
-    H_full = gf.values[1:, :].copy()  # shape: (q^r - 1) x r
-
     if q == 2 and n == (2 ** r - 1):
         # Legacy binary layout that existing tests rely on
-        H = H_full
-        H[0:exss_length] = np.flip(H[0:exss_length], axis=1)
-        H[exss_length:] = np.flip(H[exss_length:], axis=0)
-
-        H = H.T
-        H = np.flip(H, axis = 0)
-        H = np.flip(H, axis = 1)
-        H[:, -exss_length:] = np.eye(exss_length, dtype=int)
-        return H
+        return build_binary_parity_check_matrix(r, gf.pol)
 
     if q == 2 and n <= (1 << (r - 1)):
         t = max(0, n - r)
@@ -57,50 +48,46 @@ def build_parity_check_matrix(
             H[:, j] = col
         return H
 
-    seen: set[tuple[int, ...]] = set()
-    proj_cols: list[np.ndarray] = []
-    # generate all r-length vectors over [0..q-1] except the all-zero vector
-    for digits in np.ndindex(*(q for _ in range(r))):
-        v = np.array(digits, dtype=int) % q
-        if np.all(v == 0):
-            continue
-        nz = np.where(v != 0)[0]
-        i0 = nz[0]
-        inv = pow(int(v[i0]) % q, q - 2, q)
-        v_norm = (v * inv) % q
-        key = tuple(int(x) for x in v_norm.tolist())
-        if key in seen:
-            continue
-        seen.add(key)
-        proj_cols.append(v_norm.astype(int))
-        if len(proj_cols) == n:
-            break
-
-    # If for any reason we collected fewer than n, pad with distinct standard basis and zeros (shouldn't happen)
-    if len(proj_cols) < n:
-        basis = [np.eye(r, dtype=int)[:, i] for i in range(r)]
-        for b in basis:
-            if len(proj_cols) == n:
-                break
-            key = tuple(int(x) for x in b.tolist())
-            if key not in seen:
-                proj_cols.append(b.copy())
-                seen.add(key)
-        while len(proj_cols) < n:
-            proj_cols.append(np.zeros(r, dtype=int))
-
-    # Reorder columns to systematic form: last r columns are the identity vectors e_0..e_{r-1}
-    identity_cols = [tuple(int(x) for x in np.eye(r, dtype=int)[:, i].tolist()) for i in range(r)]
-    non_identity = [c for c in proj_cols if tuple(int(x) for x in c.tolist()) not in identity_cols]
-    # Ensure we have exactly n - r non-identity columns first, then the r identity columns
-    ordered_cols: list[np.ndarray] = []
-    ordered_cols.extend(non_identity[: max(0, n - r)])
-    ordered_cols.extend([np.eye(r, dtype=int)[:, i] for i in range(r)])
+    # normalized projective points (first nonzero digit is 1) in increasing
+    # order are the data columns of implicit layout, identity goes last
+    k = max(0, min(n - r, (q ** r - 1) // (q - 1) - r))
 
     H = np.zeros((r, n), dtype=int)
-    for j, col in enumerate(ordered_cols):
-        H[:, j] = col % q
+    if k > 0:
+        H[:, :k] = implicit_columns(np.arange(k), r, q)
+    H[:, n - r:] = np.eye(r, dtype=int)
+
+    return H
+
+
+def build_binary_parity_check_matrix(
+    exss_length: int, # r
+    pol: list[int] | None = None
+) -> np.ndarray[np.int32, np.int32]:
+
+    '''
+    Return binary Hamming parity-check matrix [r x (2^r - 1)] in legacy
+    layout without GF(2^r) tables: column j < n - r is v^(j + r) modulo pol
+    with highest coefficient in row 0, last r columns are identity.
+    Powers come from galua.GaluaField.binary_powers on packed integers
+    '''
+
+    r = exss_length
+    n = 2 ** r - 1
 
+    if pol is None:
+        from galua.polynomials import primitive_polynomial
+        pol = primitive_polynomial(2, r)
+
+    # packed powers, bit i is coefficient of v^i
+    powers = binary_powers(pol, r, n)
+    dtype = powers.dtype.type
+
+    # default int like other layouts, H @ words must not wrap around
+    H = np.empty((r, n), dtype=int)
+    for i in range(r):
+        H[i, :n - r] = (powers[r:] >> dtype(r - 1 - i)) & dtype(1)
+    H[:, n - r:] = np.eye(r, dtype=int)
     return H
 
 
@@ -145,6 +132,50 @@ def find_error(
     return indices_of_equal_columns
 
 
+def pack_syndromes(
+    syndromes: np.ndarray, q: int
+) -> np.ndarray:
+
+    '''
+    Return syndromes [.. x r] packed into base q integers sum(s_i * q^i)
+    '''
+
+    r = syndromes.shape[-1]
+    weights = np.power(q, np.arange(r, dtype=np.int64))
+    return (np.asarray(syndromes, dtype=np.int64) % q) @ weights
+
+
+def build_syndrome_table(
+    parity_check_matrix: np.ndarray, q: int
+) -> tuple[np.ndarray, np.ndarray]:
+
+    '''
+    Return (positions, magnitudes) indexed by packed syndrome: syndrome
+    a * H[:, j] maps to (j, a), the first j wins like in find_error_with_scalar.
+    Zero syndrome and syndromes of uncorrectable errors map to position -1
+    '''
+
+    H = np.asarray(parity_check_matrix, dtype=np.int64) % q
+    r, n = H.shape
+
+    magnitudes_range = np.arange(1, q, dtype=np.int64)
+
+    # keys[j, a - 1] is packed a * H[:, j]
+    keys = pack_syndromes((magnitudes_range[np.newaxis, :, np.newaxis] * H.T[:, np.newaxis, :]) % q, q)
+    keys = keys.ravel()
+
+    unique_keys, first = np.unique(keys, return_index=True)
+    valid = unique_keys != 0
+
+    positions = np.full(q ** r, -1, dtype=np.int64)
+    magnitudes = np.zeros(q ** r, dtype=np.int64)
+
+    positions[unique_keys[valid]] = first[valid] // (q - 1)
+    magnitudes[unique_keys[valid]] = first[valid] % (q - 1) + 1
+
+    return positions, magnitudes
+
+
 def find_error_with_scalar(
     syndrom: np.ndarray, parity_check_matrix: np.ndarray, q: int
 ) -> tuple[int | None, int | None]:
@@ -171,13 +202,6 @@ def find_error_with_scalar(
     return None, None
 
 
-def _modinv(a: int, q: int) -> int:
-    a = a % q
-    if a == 0:
-        raise ZeroDivisionError("No modular inverse for 0")
-    return pow(a, q - 2, q)
-
-
 def solve_linear_mod(
     A: np.ndarray, b: np.ndarray, q: int
 ) -> tuple[np.ndarray | None, bool]:
@@ -187,47 +211,151 @@ def solve_linear_mod(
     """
     if A.size == 0:
         return np.array([], dtype=int), True
-    A = (A % q).astype(int).copy()
-    b = (b % q).astype(int).copy()
-
-    r, c = A.shape
-    # augment
-    aug = np.concatenate([A, b.reshape(-1, 1)], axis=1)
-
-    row = 0
-    pivots: list[int] = []
-    for col in range(c):
-        pivot_row = None
-        for rr in range(row, r):
-            if aug[rr, col] % q != 0:
-                pivot_row = rr
-                break
-        if pivot_row is None:
-            continue
-        if pivot_row != row:
-            tmp = aug[row, :].copy()
-            aug[row, :] = aug[pivot_row, :]
-            aug[pivot_row, :] = tmp
-        inv = _modinv(int(aug[row, col]), q)
-        aug[row, :] = (aug[row, :] * inv) % q
-        for rr in range(r):
-            if rr == row:
-                continue
-            factor = aug[rr, col] % q
-            if factor != 0:
-                aug[rr, :] = (aug[rr, :] - factor * aug[row, :]) % q
-        pivots.append(col)
-        row += 1
-        if row == r:
-            break
-    # check consistency
-    for rr in range(r):
-        if np.all(aug[rr, :c] % q == 0) and (aug[rr, c] % q != 0):
-            return None, False
-
-    # unique solution only if number of pivots == number of variables
-    if len(pivots) != c:
+
+    x, ok = solve(A, b, q)
+    if not ok:
         return None, False
 
-    x = aug[:c, c] % q  # after RREF, top c rows correspond to variables
-    return x.astype(int), True
\ No newline at end of file
+    return x, True
+
+
+'''
+Erasures in numeric words are symbol erasure_symbol, it fits uint8 and
+is never a symbol of GF(q) for q <= 255. Symbol arrays of strings with
+'z' for erasures are converted by split_erasures once per batch.
+'''
+
+erasure_symbol = 255
+
+
+def split_erasures(
+    words: np.ndarray, q: int
+) -> tuple[np.ndarray, np.ndarray]:
+
+    '''
+    Return (values, erased): int words with erased symbols set to 0 and
+    bool erasure mask, words are numeric or strings with 'z' for erasures
+    '''
+
+    words = np.asarray(words)
+
+    if words.dtype.kind in ('U', 'S'):
+        marker, zero = ('z', '0') if words.dtype.kind == 'U' else (b'z', b'0')
+        erased = words == marker
+        values = np.where(erased, zero, words).astype(int)
+        return values, erased
+
+    if q > erasure_symbol:
+        return words.astype(int), np.zeros(words.shape, dtype=bool)
+
+    erased = words == erasure_symbol
+    return np.where(erased, 0, words).astype(int), erased
+
+
+'''
+Implicit Hamming layout: full length code with H columns being normalized
+projective points (first nonzero digit is 1) in increasing order with
+row 0 as most significant digit, identity columns e_0..e_{r-1} moved to
+the end. For q > 2 it is the layout of build_parity_check_matrix, for
+q = 2 columns are binary expansions of 3, 5, 6, 7, 9, ... Column of a
+position and position of a syndrome are computed arithmetically, so
+H, G and syndrome table are never built.
+'''
+
+def implicit_code_length(exss_length: int, q: int) -> int:
+
+    '''
+    Return length n = (q^r - 1) / (q - 1) of full Hamming code
+    '''
+
+    r = exss_length
+
+    if r < 2 or q ** r >= 2 ** 62:
+        raise ValueError("Incorrect exss_length for implicit code")
+
+    return (q ** r - 1) // (q - 1)
+
+
+def implicit_columns(
+    positions: np.ndarray, exss_length: int, q: int
+) -> np.ndarray:
+
+    '''
+    Return columns of implicit H for positions as [r x len(positions)]
+    '''
+
+    r = exss_length
+    k = implicit_code_length(r, q) - r
+    positions = np.asarray(positions, dtype=np.int64)
+
+    starts = _implicit_starts(r, q)
+
+    # column value W = sum v[i] * q^(r - 1 - i)
+    values = np.empty(positions.shape, dtype=np.int64)
+
+    data = positions < k
+    t = np.searchsorted(starts[1:], positions[data], side='right')
+    values[data] = np.power(q, t) + positions[data] - starts[t] + 1
+    values[~data] = np.power(q, r - 1 - (positions[~data] - k))
+
+    weights = np.power(q, np.arange(r - 1, -1, -1, dtype=np.int64))
+    return (values[np.newaxis, :] // weights[:, np.newaxis]) % q
+
+
+def implicit_syndromes(
+    words: np.ndarray, exss_length: int, q: int, block_size: int = 1 << 12
+) -> np.ndarray:
+
+    '''
+    Return words [m x l] @ (first l columns of implicit H)^T, columns are
+    generated per block of positions, memory O(r * block_size)
+    '''
+
+    words = np.asarray(words)
+    result = np.zeros((words.shape[0], exss_length), dtype=int)
+
+    for start in range(0, words.shape[1], block_size):
+        stop = min(start + block_size, words.shape[1])
+        columns = implicit_columns(np.arange(start, stop), exss_length, q)
+        result = (result + gf_matmul(words[:, start:stop], columns.T, q)) % q
+
+    return result
+
+
+def implicit_positions(
+    syndromes: np.ndarray, q: int
+) -> tuple[np.ndarray, np.ndarray]:
+
+    '''
+    Return (positions, magnitudes) of single errors for syndromes [m x r]
+    of implicit code, same contract as build_syndrome_table lookup
+    '''
+
+    s = np.asarray(syndromes, dtype=np.int64) % q
+    m, r = s.shape
+    k = implicit_code_length(r, q) - r
+
+    nonzero = s != 0
+    leading = np.argmax(nonzero, axis=1)
+    magnitudes = s[np.arange(m), leading]
+
+    # divide by leading digit, then syndrome is column value W
+    inverses = np.array([0] + [pow(x, q - 2, q) for x in range(1, q)], dtype=np.int64)
+    normalized = (s * inverses[magnitudes][:, np.newaxis]) % q
+
+    weights = np.power(q, np.arange(r - 1, -1, -1, dtype=np.int64))
+    values = normalized @ weights
+
+    t = r - 1 - leading
+    tail = values - np.power(q, t)
+
+    positions = np.where(tail == 0, k + leading, _implicit_starts(r, q)[t] + tail - 1)
+    positions[~np.any(nonzero, axis=1)] = -1
+
+    return positions, magnitudes
+
+
+def _implicit_starts(r: int, q: int) -> np.ndarray:
+    # starts[t] is first data position of columns with leading digit at row r - 1 - t
+    t = np.arange(r, dtype=np.int64)
+    return (np.power(q, t) - 1) // (q - 1) - t
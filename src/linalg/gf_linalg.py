@@ -0,0 +1,242 @@
+import numpy as np
+
+
+'''
+Linear algebra over GF(q), q prime. Gaussian elimination runs one pivot
+column per step, the step itself is a single vectorized outer-product
+update of the whole matrix (xor of bool arrays for q = 2).
+'''
+
+def rref(
+    A: np.ndarray, q: int
+) -> tuple[np.ndarray, list[int]]:
+
+    '''
+    Return reduced row echelon form of A over GF(q) and pivot columns
+    '''
+
+    R, pivots = _eliminate(_prepare(A, q), q, np.shape(A)[1])
+    return R.astype(int), pivots
+
+
+def rank(A: np.ndarray, q: int) -> int:
+    return len(rref(A, q)[1])
+
+
+def inverse(A: np.ndarray, q: int) -> np.ndarray:
+
+    '''
+    Return inverse of square matrix A over GF(q)
+    '''
+
+    A = np.asarray(A)
+    n = A.shape[0]
+
+    if A.ndim != 2 or A.shape[1] != n:
+        raise ValueError("Matrix must be square")
+
+    aug = _prepare(np.concatenate([A % q, np.eye(n, dtype=int)], axis=1), q)
+    R, pivots = _eliminate(aug, q, n)
+
+    if len(pivots) != n:
+        raise ValueError("Matrix is singular")
+
+    return R[:, n:].astype(int)
+
+
+def null_space(A: np.ndarray, q: int) -> np.ndarray:
+
+    '''
+    Return basis of {x : A x = 0} over GF(q) as rows [(n - rank) x n],
+    for parity-check matrix H it is generator matrix of the code
+    and for generator matrix G it is parity-check (dual code) matrix
+    '''
+
+    R, pivots = rref(A, q)
+    n = R.shape[1]
+
+    free = np.setdiff1d(np.arange(n), pivots)
+
+    N = np.zeros((free.size, n), dtype=int)
+    N[np.arange(free.size), free] = 1
+    N[:, pivots] = (-R[:len(pivots), free].T) % q
+
+    return N
+
+
+def solve(
+    A: np.ndarray, B: np.ndarray, q: int
+) -> tuple[np.ndarray, np.ndarray | bool]:
+
+    '''
+    Solve A X = B over GF(q) for all columns of B at once (B may be vector).
+    Returns (X, ok), ok is False for columns without unique solution,
+    X holds particular solution with free variables set to zero
+    '''
+
+    A = np.asarray(A)
+    B = np.asarray(B)
+
+    vector = B.ndim == 1
+    B = B.reshape(B.shape[0], -1)
+
+    r, c = A.shape
+    R, pivots = _eliminate(_prepare(np.concatenate([A % q, B % q], axis=1), q), q, c)
+
+    rhs = R[:, c:].astype(int)
+    rank = len(pivots)
+
+    # zero rows of A part must have zero right-hand side
+    consistent = ~np.any(rhs[rank:] != 0, axis=0)
+    ok = consistent & (rank == c)
+
+    X = np.zeros((c, rhs.shape[1]), dtype=int)
+    X[pivots] = rhs[:rank]
+
+    if vector:
+        return X[:, 0], bool(ok[0])
+    return X, ok
+
+
+def factor_solver(
+    A: np.ndarray, q: int
+) -> tuple[np.ndarray, np.ndarray] | None:
+
+    '''
+    Factor A [r x c] over GF(q) once for A x = b with many b: returns
+    (S, C) where x = S b is the unique solution if C b = 0 and there is no
+    solution otherwise, None when rank of A is below c. Rows of S and C
+    are the rows of E with E [A | I] in RREF
+    '''
+
+    A = np.asarray(A)
+    r, c = A.shape
+
+    aug = _prepare(np.concatenate([A % q, np.eye(r, dtype=int)], axis=1), q)
+    R, pivots = _eliminate(aug, q, c)
+
+    if len(pivots) != c:
+        return None
+
+    E = R[:, c:].astype(int)
+    return E[:c], E[c:]
+
+
+def gf_matmul(A: np.ndarray, B: np.ndarray, q: int) -> np.ndarray:
+
+    '''
+    Return A @ B % q without int64 overflow, shapes follow numpy matmul.
+    Products run through float BLAS, exact while partial sums stay below
+    the mantissa: float32 in one go when k * (q - 1)^2 < 2^24, otherwise
+    float64 over blocks of inner dimension with reduction once per block
+    '''
+
+    A = np.asarray(A)
+    B = np.asarray(B)
+
+    k = A.shape[-1]
+    step = (q - 1) * (q - 1)
+
+    if step + q >= 2 ** 53:
+        # too wide for float64 mantissa, exact python ints
+        return (A.astype(object) % q) @ (B.astype(object) % q) % q
+
+    if k * step < 2 ** 24:
+        product = _to_float(A, q, np.float32) @ _to_float(B, q, np.float32)
+        return _float_mod(product, q).astype(int)
+
+    block = (2 ** 53 - q) // step
+
+    A = _to_float(A, q, np.float64)
+    B = _to_float(B, q, np.float64)
+
+    result = 0
+    for start in range(0, k, block):
+        part = slice(start, start + block)
+        result = _float_mod(result + A[..., part] @ B[part, ...], q)
+
+    return np.asarray(result).astype(int)
+
+
+def _to_float(A: np.ndarray, q: int, dtype) -> np.ndarray:
+    # reduce only when entries are out of [0, q)
+    if A.size and (A.dtype == bool or (A.min() >= 0 and A.max() < q)):
+        return A.astype(dtype)
+    return (A % q).astype(dtype)
+
+
+def _float_mod(x: np.ndarray, q: int) -> np.ndarray:
+    # exact for integer valued x below mantissa limit, cheaper than np.mod
+    return x - np.floor(x / q) * q
+
+
+def _prepare(A: np.ndarray, q: int) -> np.ndarray:
+    # bool for q = 2, otherwise narrowest signed type with room for deferred reductions
+    A = np.asarray(A) % q
+    if q == 2:
+        return A.astype(bool)
+    if q * q < np.iinfo(np.int16).max // 64:
+        return A.astype(np.int16)
+    if q * q < np.iinfo(np.int32).max // 1024:
+        return A.astype(np.int32)
+    return A.astype(np.int64)
+
+
+def _eliminate(
+    M: np.ndarray, q: int, columns: int
+) -> tuple[np.ndarray, list[int]]:
+
+    # reduce M in place to RREF with pivots in first `columns` columns
+    rows = M.shape[0]
+
+    pivots: list[int] = []
+    row = 0
+
+    if q > 2:
+        inverses = np.array([0] + [pow(x, q - 2, q) for x in range(1, q)], dtype=M.dtype)
+        # entries are kept below `bound` and reduced mod q only before overflow
+        limit = np.iinfo(M.dtype).max - q * q
+        bound = q
+
+    for col in range(columns):
+        if row == rows:
+            break
+
+        tail = M[:, col:]
+
+        if q > 2:
+            tail[:, 0] %= q
+
+        candidates = np.flatnonzero(tail[row:, 0])
+        if candidates.size == 0:
+            continue
+
+        pivot_row = row + candidates[0]
+        if pivot_row != row:
+            M[[row, pivot_row]] = M[[pivot_row, row]]
+
+        if q == 2:
+            factors = tail[:, 0].copy()
+            factors[row] = False
+            tail ^= np.outer(factors, tail[row])
+        else:
+            tail[row] %= q
+            tail[row] = (tail[row] * inverses[tail[row, 0]]) % q
+            factors = tail[:, 0].copy()
+            factors[row] = 0
+
+            if bound > limit:
+                tail %= q
+                bound = q
+
+            # adds f * (q - p) instead of subtracting f * p to stay nonnegative
+            tail += np.outer(factors, q - tail[row])
+            bound += (q - 1) * q
+
+        pivots.append(col)
+        row += 1
+
+    if q > 2:
+        M %= q
+
+    return M, pivots
@@ -1,12 +1,23 @@
 import numpy as np
 
 from linalg.code_matrix import *
+from linalg.gf_linalg import rref, rank, inverse, null_space, solve, factor_solver, gf_matmul
+from linalg.bit_packed import *
+from linalg.bit_sliced import *
 
 def run_all_tests():
 
     parity_check()
+    binary_parity_check()
+    projective_parity_check()
     generator_check()
     syndrom_check()
+    gf_linalg_check()
+    gf_matmul_check()
+    syndrome_table_check()
+    implicit_check()
+    bit_packed_check()
+    bit_sliced_check()
     print("All Linalg tests passed")
 
 def parity_check():
@@ -33,6 +44,43 @@ def parity_check():
     )
 
 
+def binary_parity_check():
+
+    for r in range(2, 11):
+        n = 2 ** r - 1
+        gf = GaluaField.primitive(2, r)
+        H = build_binary_parity_check_matrix(r)
+
+        # column j is v^(j + r) with highest coefficient first
+        assert np.all(H[:, :n - r] == gf.values[r + 1:, ::-1].T)
+        assert np.all(H[:, n - r:] == np.eye(r, dtype=int))
+        assert np.all(H == build_parity_check_matrix(n, r, gf))
+        assert H.dtype == build_parity_check_matrix(n - 1, r, gf).dtype == np.dtype(int)
+
+        # all columns are distinct and nonzero
+        packed = pack_syndromes(H.T, 2)
+        assert np.unique(packed).size == n and np.all(packed != 0)
+
+
+def projective_parity_check():
+
+    for q, r in ((3, 2), (3, 4), (5, 3)):
+        gf = GaluaField.primitive(q, r)
+        full = (q ** r - 1) // (q - 1)
+
+        for n in (r + 1, full // 2, full):
+            H = build_parity_check_matrix(n, r, gf)
+            assert H.shape == (r, n)
+            assert np.all(H[:, n - r:] == np.eye(r, dtype=int))
+
+            # first nonzero digit is 1, values increase so no two columns are proportional
+            leading = H[np.argmax(H != 0, axis=0), np.arange(n)]
+            assert np.all(leading == 1)
+            values = H[:, :n - r].T @ np.power(q, np.arange(r - 1, -1, -1))
+            assert np.all(np.diff(values) > 0)
+            assert not np.any(np.isin(values, np.power(q, np.arange(r))))
+
+
 def generator_check():
 
     H = np.array([
@@ -80,3 +128,176 @@ def syndrom_check():
     ind = find_error(s, H)
 
     assert np.all(s == H[:, ind])
+
+
+def gf_linalg_check():
+
+    H = np.array([
+        [1, 1, 0, 1, 1, 0, 0],
+        [0, 1, 1, 1, 0, 1, 0],
+        [1, 1, 1, 0, 0, 0, 1]
+    ])
+
+    R, pivots = rref(H, 2)
+    assert pivots == [0, 1, 2] and rank(H, 2) == 3
+    assert np.all(R[:, pivots] == np.eye(3))
+
+    # dual code of H is generated by G
+    G = null_space(H, 2)
+    assert G.shape == (4, 7)
+    assert np.all(H @ G.T % 2 == 0)
+    assert rank(np.concatenate([G, build_generator_matrix(H)]), 2) == 4
+
+    A = np.array([
+        [2, 1, 0],
+        [1, 1, 1],
+        [0, 1, 1]
+    ])
+    A_inv = inverse(A, 3)
+    assert np.all(A @ A_inv % 3 == np.eye(3))
+
+    # several right-hand sides at once, rank deficient system has no unique solution
+    S = np.array([
+        [1, 2],
+        [2, 4]
+    ])
+    X, ok = solve(S, np.array([[1, 1], [2, 0]]), 5)
+    assert list(ok) == [False, False]
+
+    B = np.array([[1, 0, 4], [0, 1, 3], [2, 2, 0]])
+    X, ok = solve(A_inv, B, 3)
+    assert np.all(ok) and np.all(X == A @ B % 3)
+
+    x, ok = solve_linear_mod(A_inv, B[:, 0], 3)
+    assert ok and np.all(x == A @ B[:, 0] % 3)
+
+    # factored solver agrees with solve on consistent and inconsistent columns
+    rng = np.random.default_rng(24)
+    T = rng.integers(0, 5, size=(6, 3))
+    B = np.concatenate([T @ rng.integers(0, 5, size=(3, 20)) % 5, rng.integers(0, 5, size=(6, 20))], axis=1)
+
+    X, ok = solve(T, B, 5)
+    F, C = factor_solver(T, 5)
+    assert np.array_equal(~np.any(gf_matmul(C, B, 5) != 0, axis=0), ok)
+    assert np.all(gf_matmul(F, B[:, ok], 5) == X[:, ok])
+
+    assert factor_solver(S, 5) is None
+
+
+def gf_matmul_check():
+
+    rng = np.random.default_rng(0)
+
+    # float32 path, blocked float64 path and python ints for q near 2^31
+    for q, k in ((2, 57), (7, 120), (257, 400), (2 ** 31 - 1, 20)):
+        A = rng.integers(0, q, (30, k))
+        B = rng.integers(0, q, (k, 10))
+        expected = (A.astype(object) @ B.astype(object)) % q
+
+        assert np.all(gf_matmul(A, B, q) == expected)
+        assert np.all(gf_matmul(A[0], B, q) == expected[0])
+
+    # negative entries are taken mod q
+    A = np.array([[-1, 2], [3, -4]])
+    assert np.all(gf_matmul(A, np.eye(2, dtype=int), 5) == A % 5)
+
+
+def syndrome_table_check():
+
+    # GF(3) Hamming (4, 2) code
+    H = np.array([
+        [1, 1, 1, 0],
+        [1, 2, 0, 1]
+    ])
+    positions, magnitudes = build_syndrome_table(H, 3)
+
+    assert positions.shape == (9,) and positions[0] == -1
+    for s in np.ndindex(3, 3):
+        j, a = find_error_with_scalar(np.array(s), H, 3)
+        packed = pack_syndromes(np.array(s), 3)
+        assert positions[packed] == (-1 if j is None else j)
+        if j is not None:
+            assert magnitudes[packed] == a
+
+
+def implicit_check():
+
+    for q, r in ((2, 3), (2, 5), (3, 3), (5, 2)):
+        n = implicit_code_length(r, q)
+        H = implicit_columns(np.arange(n), r, q)
+
+        # same layout as projective branch of build_parity_check_matrix
+        if q > 2:
+            assert np.all(H == build_parity_check_matrix(n, r, GaluaField.primitive(q, r)))
+        assert np.all(H[:, n - r:] == np.eye(r, dtype=int))
+
+        syndromes = np.array([(a * H[:, j]) % q for j in range(n) for a in range(1, q)])
+        positions, magnitudes = implicit_positions(syndromes, q)
+
+        assert np.all(positions == np.repeat(np.arange(n), q - 1))
+        assert np.all(magnitudes == np.tile(np.arange(1, q), n))
+        assert implicit_positions(np.zeros((1, r), dtype=int), q)[0][0] == -1
+
+        words = np.random.default_rng(q).integers(0, q, (5, n))
+        assert np.all(implicit_syndromes(words, r, q, block_size=3) == (words @ H.T) % q)
+
+    try:
+        implicit_code_length(1, 2)
+        assert False
+    except ValueError:
+        pass
+
+
+def bit_packed_check():
+
+    rng = np.random.default_rng(64)
+
+    for n in (1, 63, 64, 65, 200):
+        bits = rng.integers(0, 2, (7, n))
+        packed = pack_bits(bits)
+
+        assert packed.dtype == np.uint64 and packed.shape == (7, packed_width(n))
+        assert np.all(unpack_bits(packed, n) == bits)
+
+        # xor of selected rows and parity of and agree with matmul mod 2
+        G = rng.integers(0, 2, (5, n))
+        H = rng.integers(0, 2, (9, n))
+        info = rng.integers(0, 2, (7, 5))
+
+        assert np.all(binary_encode(info, build_encoding_tables(G), n) == (info @ G) % 2)
+        assert np.all(packed_syndromes(packed, pack_bits(H)) == pack_syndromes((bits @ H.T) % 2, 2))
+
+        flip_bits(packed, np.array([0, 3]), np.array([n - 1, 0]))
+        bits[0, n - 1] ^= 1
+        bits[3, 0] ^= 1
+        assert np.all(unpack_bits(packed, n) == bits)
+
+
+def bit_sliced_check():
+
+    rng = np.random.default_rng(65)
+
+    # duplicate and zero columns: first match wins, zero syndrome is not an error
+    H = np.array([
+        [1, 0, 1, 1, 0, 1],
+        [0, 1, 1, 0, 0, 1],
+        [1, 1, 0, 1, 0, 1],
+    ])
+    positions, _ = build_syndrome_table(H, 2)
+
+    for m in (1, 64, 130):
+        words = rng.integers(0, 2, (m, H.shape[1]))
+        planes = slice_bits(words)
+
+        assert planes.shape == (H.shape[1], packed_width(m))
+        assert np.all(unslice_bits(planes, m) == words)
+
+        syndromes = unslice_bits(sliced_syndromes(planes, H), m)
+        assert np.all(syndromes == (words @ H.T) % 2)
+
+        expected = words.copy()
+        j = positions[pack_syndromes(syndromes, 2)]
+        rows = np.flatnonzero(j >= 0)
+        expected[rows, j[rows]] ^= 1
+
+        assert np.all(unslice_bits(sliced_correct(planes, H), m) == expected)